@@ -18,6 +18,12 @@ from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Precompiled statements reused across requests. Building text() inside a
+# function allocates a new construct per call and bypasses SQLAlchemy's
+# compiled-statement cache, so hot statements are lifted to module scope.
+_PG_VERSION_SQL = text("SELECT version()")
+_POSTGIS_VERSION_SQL = text("SELECT PostGIS_Version()")
+
 # SQLAlchemy setup
 Base = declarative_base()
 
@@ -97,14 +103,14 @@ class DatabaseManager:
         
         # Test async connection
         async with self.async_engine.begin() as conn:
-            result = await conn.execute(text("SELECT version()"))
+            result = await conn.execute(_PG_VERSION_SQL)
             version = result.scalar()
             logger.info(f"📡 Connected to PostgreSQL: {version}")
         
         # Test PostGIS availability
         try:
             async with self.async_engine.begin() as conn:
-                result = await conn.execute(text("SELECT PostGIS_Version()"))
+                result = await conn.execute(_POSTGIS_VERSION_SQL)
                 postgis_version = result.scalar()
                 logger.info(f"🗺️ PostGIS available: {postgis_version}")
         except Exception as e:
@@ -189,30 +195,34 @@ async def get_db_connection():
 async def init_database():
     """Initialize database connections and create tables."""
     await db_manager.initialize()
-    
+
+    # Enable required extensions first: table creation depends on them
+    # (geometry columns need postgis, the composite (project_id, geometry)
+    # GiST index needs btree_gist for the integer column).
+    await _ensure_postgis_extension()
+
     # Create tables if they don't exist
     await db_manager.create_tables()
-    
-    # Enable PostGIS extension if not already enabled
-    await _ensure_postgis_extension()
 
 async def _ensure_postgis_extension():
-    """Ensure PostGIS extension is enabled."""
-    try:
-        async with db_manager.async_engine.begin() as conn:
-            # Check if PostGIS is already enabled
-            result = await conn.execute(
-                text("SELECT EXISTS(SELECT 1 FROM pg_extension WHERE extname = 'postgis')")
-            )
-            if not result.scalar():
-                # Try to enable PostGIS
-                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS postgis"))
-                logger.info("✅ PostGIS extension enabled")
-            else:
-                logger.info("✅ PostGIS extension already enabled")
-    except Exception as e:
-        logger.warning(f"⚠️ Could not enable PostGIS extension: {str(e)}")
-        logger.info("💡 Please manually enable PostGIS: CREATE EXTENSION IF NOT EXISTS postgis;")
+    """Ensure the PostGIS and btree_gist extensions are enabled."""
+    for extension in ("postgis", "btree_gist"):
+        try:
+            async with db_manager.async_engine.begin() as conn:
+                # Check if the extension is already enabled
+                result = await conn.execute(
+                    text("SELECT EXISTS(SELECT 1 FROM pg_extension WHERE extname = :name)"),
+                    {"name": extension},
+                )
+                if not result.scalar():
+                    # Try to enable it
+                    await conn.execute(text(f"CREATE EXTENSION IF NOT EXISTS {extension}"))
+                    logger.info(f"✅ {extension} extension enabled")
+                else:
+                    logger.info(f"✅ {extension} extension already enabled")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not enable {extension} extension: {str(e)}")
+            logger.info(f"💡 Please manually enable it: CREATE EXTENSION IF NOT EXISTS {extension};")
 
 async def close_database():
     """Close database connections."""
@@ -274,13 +284,13 @@ async def check_database_health() -> dict:
         
         async with db_manager.async_engine.begin() as conn:
             # Check PostgreSQL version
-            result = await conn.execute(text("SELECT version()"))
+            result = await conn.execute(_PG_VERSION_SQL)
             health_info["version"] = result.scalar()
             health_info["connected"] = True
             
             # Check PostGIS
             try:
-                result = await conn.execute(text("SELECT PostGIS_Version()"))
+                result = await conn.execute(_POSTGIS_VERSION_SQL)
                 health_info["postgis_version"] = result.scalar()
                 health_info["postgis_available"] = True
             except Exception:
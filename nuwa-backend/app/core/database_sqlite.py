@@ -12,6 +12,7 @@ from sqlalchemy.pool import StaticPool
 import logging
 import asyncio
 import sqlite3
+import orjson
 import os
 from typing import AsyncGenerator, Optional
 from contextlib import asynccontextmanager
@@ -20,6 +21,23 @@ from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# orjson round-trip helpers, wired into the engines below as the JSON
+# column (de)serializer. orjson parses and serializes ~5x faster than the
+# stdlib json module, so every JSON column read/write benefits.
+def json_loads(value):
+    """Parse a JSON column value; None passes through."""
+    return orjson.loads(value) if value else None
+
+def json_dumps(value):
+    """Serialize a value for a JSON column; None passes through."""
+    return orjson.dumps(value).decode() if value is not None else None
+
+# Precompiled statements reused across requests. Building text() inside a
+# function allocates a new construct per call and bypasses SQLAlchemy's
+# compiled-statement cache, so hot statements are lifted to module scope.
+_SQLITE_VERSION_SQL = text("SELECT sqlite_version()")
+_TABLES_COUNT_SQL = text("SELECT COUNT(*) FROM sqlite_master WHERE type='table'")
+
 # SQLAlchemy setup
 Base = declarative_base()
 
@@ -68,6 +86,8 @@ class DatabaseManager:
                     "timeout": 30
                 },
                 pool_pre_ping=True,
+                json_serializer=json_dumps,
+                json_deserializer=json_loads,
             )
             
             # Create sync engine for migrations
@@ -76,7 +96,9 @@ class DatabaseManager:
                 sync_database_url,
                 echo=settings.is_development,
                 poolclass=StaticPool,
-                connect_args={"check_same_thread": False}
+                connect_args={"check_same_thread": False},
+                json_serializer=json_dumps,
+                json_deserializer=json_loads,
             )
             
             # Create session factories
@@ -110,7 +132,7 @@ class DatabaseManager:
         
         # Test async connection
         async with self.async_engine.begin() as conn:
-            result = await conn.execute(text("SELECT sqlite_version()"))
+            result = await conn.execute(_SQLITE_VERSION_SQL)
             version = result.scalar()
             logger.info(f"📡 Connected to SQLite: {version}")
         
@@ -317,7 +339,7 @@ async def check_database_health() -> dict:
         
         async with db_manager.async_engine.begin() as conn:
             # Check SQLite version
-            result = await conn.execute(text("SELECT sqlite_version()"))
+            result = await conn.execute(_SQLITE_VERSION_SQL)
             health_info["version"] = result.scalar()
             health_info["connected"] = True
             health_info["file_path"] = db_manager.db_path
@@ -328,9 +350,7 @@ async def check_database_health() -> dict:
                 health_info["file_size_mb"] = round(file_size / 1024 / 1024, 2)
             
             # Count tables
-            result = await conn.execute(text(
-                "SELECT COUNT(*) FROM sqlite_master WHERE type='table'"
-            ))
+            result = await conn.execute(_TABLES_COUNT_SQL)
             health_info["tables_count"] = result.scalar()
     
     except Exception as e:
@@ -24,6 +24,7 @@ from typing import Dict, Any
 from app.core.config import get_settings
 from app.core.database import get_db_connection, init_database
 from app.core.logging_config import setup_logging
+from app.utils.orjson_response import ORJSONResponse
 
 # Import API routers
 from app.api.v1.api import api_router
@@ -104,6 +105,7 @@ def create_application() -> FastAPI:
             "url": "https://opensource.org/licenses/MIT",
         },
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/docs" if settings.ENVIRONMENT != "production" else None,
         redoc_url="/redoc" if settings.ENVIRONMENT != "production" else None,
         openapi_url="/openapi.json" if settings.ENVIRONMENT != "production" else None,
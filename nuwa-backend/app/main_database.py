@@ -7,7 +7,7 @@ FastAPI application with SQLite database integration for development.
 from fastapi import FastAPI, HTTPException, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from contextlib import asynccontextmanager
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, desc
@@ -256,15 +256,15 @@ async def create_project(project_data: Dict[str, Any], db: AsyncSession = Depend
             monitoring_plan=project_data.get("monitoring_plan")
         )
         
-        # Handle JSON fields
+        # Handle JSON fields (JSON columns serialize at the engine)
         if project_data.get("species_planted"):
-            project.species_planted = json.dumps(project_data["species_planted"])
+            project.species_planted = project_data["species_planted"]
         if project_data.get("soil_types"):
-            project.soil_types = json.dumps(project_data["soil_types"])
+            project.soil_types = project_data["soil_types"]
         if project_data.get("verification_schedule"):
-            project.verification_schedule = json.dumps(project_data["verification_schedule"])
+            project.verification_schedule = project_data["verification_schedule"]
         if project_data.get("metadata"):
-            project.project_metadata = json.dumps(project_data["metadata"])
+            project.project_metadata = project_data["metadata"]
         
         # Add to database
         db.add(project)
@@ -296,8 +296,9 @@ async def list_projects(
     List projects with advanced filtering and search.
     """
     try:
-        # Build query
-        query = select(Project)
+        # Build query (narrow projection: list views never need the
+        # wide JSON/TEXT columns)
+        query = Project.query_for_list()
         
         # Apply filters
         if status:
@@ -345,6 +346,30 @@ async def list_projects(
         logger.error(f"Failed to list projects: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to retrieve projects")
 
+@app.get("/api/v1/projects/export", tags=["Projects"])
+async def export_projects(db: AsyncSession = Depends(get_db)):
+    """
+    Stream every project as newline-delimited JSON.
+
+    Rows come off a server-side cursor in batches, so the export never
+    materializes the full table in memory and the first bytes go out as
+    soon as the first batch is ready.
+    """
+    return StreamingResponse(
+        Project.stream_all(db),
+        media_type="application/x-ndjson",
+    )
+
+@app.get("/api/v1/evaluations/export", tags=["Evaluations"])
+async def export_evaluations(db: AsyncSession = Depends(get_db)):
+    """
+    Stream every evaluation as newline-delimited JSON.
+    """
+    return StreamingResponse(
+        Evaluation.stream_all(db),
+        media_type="application/x-ndjson",
+    )
+
 @app.get("/api/v1/projects/{project_id}", tags=["Projects"])
 async def get_project(project_id: int, db: AsyncSession = Depends(get_db)):
     """
@@ -360,7 +385,7 @@ async def get_project(project_id: int, db: AsyncSession = Depends(get_db)):
         
         # Get related evaluations
         evaluations_result = await db.execute(
-            select(Evaluation).where(Evaluation.project_id == project_id)
+            Evaluation.query_for_list().where(Evaluation.project_id == project_id)
         )
         evaluations = evaluations_result.scalars().all()
         
@@ -395,11 +420,7 @@ async def update_project(
         # Update fields
         for field, value in project_data.items():
             if hasattr(project, field) and value is not None:
-                if field in ["species_planted", "soil_types", "verification_schedule", "project_metadata"]:
-                    # Handle JSON fields
-                    setattr(project, field, json.dumps(value) if value else None)
-                else:
-                    setattr(project, field, value)
+                setattr(project, field, value)
         
         await db.commit()
         await db.refresh(project)
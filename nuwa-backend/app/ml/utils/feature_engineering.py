@@ -5,17 +5,71 @@ Transforms project data into ML-ready features
 
 import pandas as pd
 import numpy as np
+import joblib
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 import json
 
+# Feature columns produced for model training, in canonical order
+_FEATURE_NAMES = (
+    'area_hectares', 'duration_years', 'budget_usd',
+    'climate_factor', 'vegetation_factor', 'methodology_factor', 'soil_factor',
+    'annual_rainfall_mm', 'avg_temperature_c', 'elevation_m',
+    'area_budget_ratio', 'rainfall_temperature_index',
+    'latitude_abs', 'longitude', 'start_month', 'start_season',
+    'technology_factor', 'project_scale', 'intensity_factor'
+)
+
+def _derive_ratios(area, budget, rainfall, temperature):
+    """Derived-ratio math shared by the row and batch feature paths.
+
+    Written as plain ufunc expressions so it works on scalars and arrays
+    alike (and could be JIT-wrapped unchanged if numba ever becomes a
+    dependency).
+    """
+    area_budget_ratio = area / np.maximum(budget, 1) * 1000
+    rainfall_temperature_index = rainfall / np.maximum(temperature, 1)
+    return area_budget_ratio, rainfall_temperature_index
+
+
+# Technology level efficiency factors (shared by the row and batch paths
+# so the mapping is built once, not per extract_features call)
+_TECHNOLOGY_LEVELS = {
+    'low': 0.3,
+    'medium': 0.6,
+    'high': 0.9,
+    'advanced': 1.0
+}
+
 
 class CarbonFeatureEngineer:
     """
     Feature engineering class for carbon capture projects.
     Converts project metadata into numerical features for ML models.
     """
-    
+
+    # Month -> seasonal factor lookup, Northern Hemisphere (index 0 unused).
+    # A branchless gather replaces the if/elif chain per row.
+    _SEASON_LUT = np.array(
+        [0.0, 0.25, 0.25, 0.75, 0.75, 0.75, 1.0, 1.0, 1.0, 0.5, 0.5, 0.5, 0.25],
+        dtype=np.float32
+    )
+
+    # Narrow dtypes for bounded columns: the 0-1 factors, months and ids
+    # do not need float64, and halving their width halves the memory the
+    # training/inference materialization has to move
+    _DTYPES = {
+        'climate_factor': 'float32',
+        'vegetation_factor': 'float32',
+        'methodology_factor': 'float32',
+        'soil_factor': 'float32',
+        'technology_factor': 'float32',
+        'intensity_factor': 'float32',
+        'start_month': 'int16',
+        'start_season': 'float32',
+        'project_id': 'int32',
+    }
+
     def __init__(self):
         # Climate zone mappings (normalized 0-1)
         self.climate_zones = {
@@ -65,6 +119,19 @@ class CarbonFeatureEngineer:
             "rocky": 0.2,
             "mixed": 0.6
         }
+
+        # Specialized per-schema extractors built by compile_extractor
+        self._compiled_extractors = {}
+
+        # Factor tables keyed by project column; batch lookups dictionary-
+        # encode the column and resolve each unique category exactly once
+        self._factor_maps = {
+            'climate_zone': self.climate_zones,
+            'vegetation_type': self.vegetation_types,
+            'methodology': self.methodologies,
+            'soil_type': self.soil_types,
+            'technology_level': _TECHNOLOGY_LEVELS,
+        }
     
     def extract_features(self, project_data: Dict[str, Any]) -> Dict[str, float]:
         """
@@ -102,12 +169,11 @@ class CarbonFeatureEngineer:
         features['avg_temperature_c'] = float(project_data.get('avg_temperature_c', 20))
         features['elevation_m'] = float(project_data.get('elevation_m', 0))
         
-        # Derived features
-        features['area_budget_ratio'] = (
-            features['area_hectares'] / max(features['budget_usd'], 1) * 1000
-        )
-        features['rainfall_temperature_index'] = (
-            features['annual_rainfall_mm'] / max(features['avg_temperature_c'], 1)
+        # Derived features (shared kernel with the batch path)
+        features['area_budget_ratio'], features['rainfall_temperature_index'] = (
+            _derive_ratios(features['area_hectares'], features['budget_usd'],
+                           features['annual_rainfall_mm'],
+                           features['avg_temperature_c'])
         )
         
         # Geographic and location features
@@ -129,12 +195,9 @@ class CarbonFeatureEngineer:
         
         # Technology and management features
         technology_level = project_data.get('technology_level', 'medium')
-        features['technology_factor'] = {
-            'low': 0.3,
-            'medium': 0.6,
-            'high': 0.9,
-            'advanced': 1.0
-        }.get(technology_level.lower(), 0.6)
+        features['technology_factor'] = _TECHNOLOGY_LEVELS.get(
+            technology_level.lower(), 0.6
+        )
         
         # Scale and efficiency features
         features['project_scale'] = min(features['area_hectares'] / 1000, 1.0)  # Normalized to 1000ha
@@ -148,43 +211,278 @@ class CarbonFeatureEngineer:
     
     def _get_season(self, month: int) -> float:
         """Convert month to seasonal factor (Northern Hemisphere)"""
-        if month in [12, 1, 2]:  # Winter
-            return 0.25
-        elif month in [3, 4, 5]:  # Spring
-            return 0.75
-        elif month in [6, 7, 8]:  # Summer
-            return 1.0
-        else:  # Fall
-            return 0.5
+        return float(self._SEASON_LUT[month])
     
+    def extract_features_batch(self, projects: List[Dict[str, Any]]) -> pd.DataFrame:
+        """
+        Extract features for a batch of projects in one vectorized pass.
+
+        Produces the same columns as extract_features, but every feature
+        is computed with pandas/NumPy operations over the whole batch
+        instead of Python-level lookups and arithmetic per row.
+
+        Args:
+            projects: List of project dictionaries
+
+        Returns:
+            Pandas DataFrame with one feature row per project
+        """
+        raw = projects if isinstance(projects, pd.DataFrame) else pd.DataFrame(projects)
+        n = len(raw)
+
+        def numeric(col: str, default: float) -> np.ndarray:
+            if col in raw.columns:
+                values = pd.to_numeric(raw[col], errors='coerce')
+                return values.fillna(default).to_numpy(dtype=np.float64)
+            return np.full(n, float(default))
+
+        def factor(col: str, fallback: str, default: float) -> np.ndarray:
+            mapping = self._factor_maps[col]
+            if col not in raw.columns:
+                return np.full(n, mapping[fallback])
+            series = raw[col]
+            if not isinstance(series.dtype, pd.CategoricalDtype):
+                # Dictionary-encode first: lowercasing and hash probes then
+                # run once per unique category instead of once per row
+                series = series.astype('category')
+            # Resolve each category once, then gather by code; the
+            # trailing slot serves the NaN code (-1)
+            table = np.array(
+                [mapping.get(str(c).lower(), default)
+                 for c in series.cat.categories] + [mapping[fallback]],
+                dtype=np.float64
+            )
+            return table[series.cat.codes.to_numpy()]
+
+        area = numeric('area_hectares', 0)
+        budget = numeric('budget_usd', 0)
+        rainfall = numeric('annual_rainfall_mm', 1000)
+        temperature = numeric('avg_temperature_c', 20)
+
+        climate = factor('climate_zone', 'temperate', 0.6)
+        vegetation = factor('vegetation_type', 'mixed', 0.6)
+        methodology = factor('methodology', 'other', 0.4)
+
+        # Temporal features (defaults mirror the single-row path). An
+        # integer start_month column short-circuits datetime parsing
+        # entirely — the synthetic generator uses this path.
+        if 'start_month' in raw.columns:
+            months = pd.to_numeric(
+                raw['start_month'], errors='coerce'
+            ).to_numpy(dtype=np.float64)
+        elif 'start_date' in raw.columns:
+            dates = raw['start_date']
+            # format='ISO8601' pins pandas to its C parser (which also
+            # handles the 'Z' suffix natively) instead of inferring the
+            # format; only applicable when the column holds strings
+            kwargs = {'format': 'ISO8601'} if dates.dtype == object else {}
+            start = pd.to_datetime(dates, errors='coerce', utc=True, **kwargs)
+            months = start.dt.month.to_numpy(dtype=np.float64)
+        else:
+            months = np.full(n, np.nan)
+
+        missing = np.isnan(months)
+        month_idx = np.where(missing, 0, months).astype(np.int64)
+        season = np.where(
+            missing, 2.0, self._SEASON_LUT[month_idx].astype(np.float64)
+        )
+        months = np.where(missing, 6.0, months)
+
+        technology = factor('technology_level', 'medium', 0.6)
+        ratios = _derive_ratios(area, budget, rainfall, temperature)
+
+        features = pd.DataFrame({
+            'area_hectares': area,
+            'duration_years': numeric('duration_years', 1),
+            'budget_usd': budget,
+            'climate_factor': climate,
+            'vegetation_factor': vegetation,
+            'methodology_factor': methodology,
+            'soil_factor': factor('soil_type', 'mixed', 0.6),
+            'annual_rainfall_mm': rainfall,
+            'avg_temperature_c': temperature,
+            'elevation_m': numeric('elevation_m', 0),
+            'area_budget_ratio': ratios[0],
+            'rainfall_temperature_index': ratios[1],
+            'latitude_abs': np.abs(numeric('latitude', 0)),
+            'longitude': numeric('longitude', 0),
+            'start_month': months,
+            'start_season': season,
+            'technology_factor': technology,
+            'project_scale': np.minimum(area / 1000, 1.0),
+            'intensity_factor': methodology * vegetation * climate,
+        })
+        return features.astype(
+            {k: v for k, v in self._DTYPES.items() if k in features.columns}
+        )
+
+    def extract_features_df(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Vectorized feature extraction for an existing project DataFrame.
+
+        Preferred over per-row extract_features calls whenever the caller
+        already holds tabular data: every lookup runs through pandas'
+        C-level hashtables and code gathers instead of Python dict.get.
+        """
+        return self.extract_features_batch(df)
+
     def create_feature_dataframe(self, projects: List[Dict[str, Any]]) -> pd.DataFrame:
         """
         Convert list of projects to feature DataFrame.
-        
+
         Args:
             projects: List of project dictionaries
-            
+
         Returns:
             Pandas DataFrame with extracted features
         """
-        feature_list = []
-        for project in projects:
-            features = self.extract_features(project)
-            features['project_id'] = project.get('id', 0)
-            feature_list.append(features)
-        
-        return pd.DataFrame(feature_list)
+        df = self.extract_features_batch(projects)
+        df['project_id'] = np.asarray(
+            [project.get('id', 0) for project in projects],
+            dtype=self._DTYPES['project_id']
+        )
+        return df
     
+    def compile_extractor(self, schema: tuple):
+        """Generate a row extractor specialized for a fixed key schema.
+
+        Builds (once per schema, via exec) a function that reads values
+        positionally from a tuple ordered like `schema`, with defaults
+        and factor tables resolved at compile time — no dict.get hashing
+        or default branches remain on the per-call path. Intended for
+        callers that feed many rows with an identical key set:
+
+            extract = engineer.compile_extractor(('area_hectares', ...))
+            features = extract((1000.0, ...))
+
+        Returns the same feature dict as extract_features.
+        """
+        schema = tuple(schema)
+        cached = self._compiled_extractors.get(schema)
+        if cached is not None:
+            return cached
+
+        idx = {key: i for i, key in enumerate(schema)}
+
+        def num(key: str, default: float) -> str:
+            if key in idx:
+                return f"float(values[{idx[key]}])"
+            return repr(float(default))
+
+        def cat(key: str, fallback: str, default: float) -> str:
+            if key in idx:
+                return (f"_maps[{key!r}].get(str(values[{idx[key]}]).lower(), "
+                        f"{default!r})")
+            return repr(self._factor_maps[key][fallback])
+
+        if 'start_month' in idx:
+            temporal = (
+                f"    start_month = int(values[{idx['start_month']}])\n"
+                f"    start_season = float(_season[start_month])\n"
+            )
+        elif 'start_date' in idx:
+            temporal = (
+                f"    _sd = values[{idx['start_date']}]\n"
+                f"    if _sd:\n"
+                f"        if isinstance(_sd, str):\n"
+                f"            _sd = _datetime.fromisoformat(_sd.replace('Z', '+00:00'))\n"
+                f"        start_month = _sd.month\n"
+                f"        start_season = float(_season[start_month])\n"
+                f"    else:\n"
+                f"        start_month, start_season = 6, 2\n"
+            )
+        else:
+            temporal = "    start_month, start_season = 6, 2\n"
+
+        source = (
+            "def _extract(values):\n"
+            f"    area_hectares = {num('area_hectares', 0)}\n"
+            f"    budget_usd = {num('budget_usd', 0)}\n"
+            f"    annual_rainfall_mm = {num('annual_rainfall_mm', 1000)}\n"
+            f"    avg_temperature_c = {num('avg_temperature_c', 20)}\n"
+            f"    climate_factor = {cat('climate_zone', 'temperate', 0.6)}\n"
+            f"    vegetation_factor = {cat('vegetation_type', 'mixed', 0.6)}\n"
+            f"    methodology_factor = {cat('methodology', 'other', 0.4)}\n"
+            f"{temporal}"
+            "    return {\n"
+            "        'area_hectares': area_hectares,\n"
+            f"        'duration_years': {num('duration_years', 1)},\n"
+            "        'budget_usd': budget_usd,\n"
+            "        'climate_factor': climate_factor,\n"
+            "        'vegetation_factor': vegetation_factor,\n"
+            "        'methodology_factor': methodology_factor,\n"
+            f"        'soil_factor': {cat('soil_type', 'mixed', 0.6)},\n"
+            "        'annual_rainfall_mm': annual_rainfall_mm,\n"
+            "        'avg_temperature_c': avg_temperature_c,\n"
+            f"        'elevation_m': {num('elevation_m', 0)},\n"
+            "        'area_budget_ratio': area_hectares / "
+            "(budget_usd if budget_usd > 1 else 1) * 1000,\n"
+            "        'rainfall_temperature_index': annual_rainfall_mm / "
+            "(avg_temperature_c if avg_temperature_c > 1 else 1),\n"
+            f"        'latitude_abs': abs({num('latitude', 0)}),\n"
+            f"        'longitude': {num('longitude', 0)},\n"
+            "        'start_month': start_month,\n"
+            "        'start_season': start_season,\n"
+            f"        'technology_factor': {cat('technology_level', 'medium', 0.6)},\n"
+            "        'project_scale': area_hectares / 1000 "
+            "if area_hectares < 1000 else 1.0,\n"
+            "        'intensity_factor': methodology_factor * "
+            "vegetation_factor * climate_factor,\n"
+            "    }\n"
+        )
+
+        namespace = {
+            '_maps': self._factor_maps,
+            '_season': self._SEASON_LUT,
+            '_datetime': datetime,
+        }
+        exec(source, namespace)
+
+        extractor = namespace['_extract']
+        self._compiled_extractors[schema] = extractor
+        return extractor
+
+    def create_feature_dataframe_parallel(self, projects: List[Dict[str, Any]],
+                                          n_workers: Optional[int] = None) -> pd.DataFrame:
+        """
+        Parallel variant of create_feature_dataframe for very large batches.
+
+        Splits the projects across workers and runs the vectorized
+        extractor on each chunk; feature extraction is embarrassingly
+        parallel across rows. Small batches fall through to the serial
+        path, where process startup would dominate.
+
+        Args:
+            projects: List of project dictionaries
+            n_workers: Worker count (defaults to the CPU count)
+
+        Returns:
+            Pandas DataFrame with extracted features
+        """
+        n_workers = n_workers or joblib.cpu_count()
+        if len(projects) < 10000 or n_workers <= 1:
+            return self.create_feature_dataframe(projects)
+
+        chunk_size = -(-len(projects) // n_workers)
+        chunks = [
+            projects[i:i + chunk_size]
+            for i in range(0, len(projects), chunk_size)
+        ]
+        frames = joblib.Parallel(n_jobs=n_workers)(
+            joblib.delayed(self.extract_features_batch)(chunk)
+            for chunk in chunks
+        )
+
+        df = pd.concat(frames, ignore_index=True)
+        df['project_id'] = np.asarray(
+            [project.get('id', 0) for project in projects],
+            dtype=self._DTYPES['project_id']
+        )
+        return df
+
     def get_feature_names(self) -> List[str]:
         """Get list of feature names for model training."""
-        return [
-            'area_hectares', 'duration_years', 'budget_usd',
-            'climate_factor', 'vegetation_factor', 'methodology_factor', 'soil_factor',
-            'annual_rainfall_mm', 'avg_temperature_c', 'elevation_m',
-            'area_budget_ratio', 'rainfall_temperature_index',
-            'latitude_abs', 'longitude', 'start_month', 'start_season',
-            'technology_factor', 'project_scale', 'intensity_factor'
-        ]
+        return list(_FEATURE_NAMES)
 
 
 def generate_synthetic_training_data(n_samples: int = 1000) -> pd.DataFrame:
@@ -197,66 +495,71 @@ def generate_synthetic_training_data(n_samples: int = 1000) -> pd.DataFrame:
     Returns:
         DataFrame with features and target CO2 capture values
     """
-    np.random.seed(42)  # For reproducible results
-    
+    rng = np.random.default_rng(42)  # For reproducible results
+
     feature_engineer = CarbonFeatureEngineer()
-    projects = []
-    
-    for i in range(n_samples):
-        # Generate realistic project parameters
-        area = np.random.lognormal(mean=5, sigma=1.5)  # Log-normal distribution for area
-        area = max(10, min(area, 50000))  # Clamp between 10 and 50,000 hectares
-        
-        duration = np.random.uniform(5, 30)  # 5-30 years
-        
-        # Budget correlates with area but with some noise
-        budget = area * np.random.uniform(500, 5000) + np.random.normal(0, area * 100)
-        budget = max(10000, budget)
-        
-        # Random climate and ecosystem parameters
-        climate_zones = list(feature_engineer.climate_zones.keys())
-        vegetation_types = list(feature_engineer.vegetation_types.keys())
-        methodologies = list(feature_engineer.methodologies.keys())
-        soil_types = list(feature_engineer.soil_types.keys())
-        
-        project = {
-            'id': i,
-            'area_hectares': area,
-            'duration_years': duration,
-            'budget_usd': budget,
-            'climate_zone': np.random.choice(climate_zones),
-            'vegetation_type': np.random.choice(vegetation_types),
-            'methodology': np.random.choice(methodologies),
-            'soil_type': np.random.choice(soil_types),
-            'annual_rainfall_mm': np.random.uniform(200, 4000),
-            'avg_temperature_c': np.random.uniform(-10, 35),
-            'elevation_m': np.random.uniform(0, 4000),
-            'latitude': np.random.uniform(-60, 60),
-            'longitude': np.random.uniform(-180, 180),
-            'start_date': datetime(2020, np.random.randint(1, 13), 1).isoformat(),
-            'technology_level': np.random.choice(['low', 'medium', 'high', 'advanced'])
-        }
-        
-        projects.append(project)
-    
-    # Create feature DataFrame
-    df = feature_engineer.create_feature_dataframe(projects)
-    
+
+    # One uniform block covers every linearly-transformed field: a single
+    # RNG call emits 7*n deviates instead of one C call per field
+    uniforms = rng.random((n_samples, 7))
+    area = np.clip(rng.lognormal(5, 1.5, n_samples), 10, 50000)
+    duration = 5 + 25 * uniforms[:, 0]
+
+    # Budget correlates with area but with some noise
+    budget = np.maximum(
+        area * (500 + 4500 * uniforms[:, 1]) + rng.normal(0, area * 100),
+        10000
+    )
+
+    months = rng.integers(1, 13, n_samples)
+
+    def sample_categories(categories: List[str]) -> pd.Categorical:
+        # Sample integer codes and wrap them directly: no string arrays
+        # are materialized and the extractor gathers by code
+        codes = rng.integers(0, len(categories), n_samples)
+        return pd.Categorical.from_codes(codes, categories=categories)
+
+    projects = pd.DataFrame({
+        'id': np.arange(n_samples),
+        'area_hectares': area,
+        'duration_years': duration,
+        'budget_usd': budget,
+        'climate_zone': sample_categories(list(feature_engineer.climate_zones)),
+        'vegetation_type': sample_categories(list(feature_engineer.vegetation_types)),
+        'methodology': sample_categories(list(feature_engineer.methodologies)),
+        'soil_type': sample_categories(list(feature_engineer.soil_types)),
+        'annual_rainfall_mm': 200 + 3800 * uniforms[:, 2],
+        'avg_temperature_c': -10 + 45 * uniforms[:, 3],
+        'elevation_m': 4000 * uniforms[:, 4],
+        'latitude': -60 + 120 * uniforms[:, 5],
+        'longitude': -180 + 360 * uniforms[:, 6],
+        'start_month': months,
+        'technology_level': sample_categories(['low', 'medium', 'high', 'advanced']),
+    })
+
+    # Create feature DataFrame (vectorized batch path)
+    df = feature_engineer.extract_features_batch(projects)
+    df['project_id'] = projects['id'].to_numpy()
+
     # Generate realistic CO2 capture targets based on features
-    # This uses a combination of area, intensity factors, and some noise
+    # This uses a combination of area, intensity factors, and some noise.
+    # Computed on the raw ndarrays with in-place multiplies: one target
+    # buffer instead of an intermediate Series per operator.
     base_co2_per_hectare = 10  # Base tons CO2/hectare/year
-    
-    df['co2_capture_tons_year'] = (
-        df['area_hectares'] * 
-        df['intensity_factor'] * 
-        base_co2_per_hectare * 
-        (1 + df['technology_factor'] * 0.5) *  # Technology boost
-        (1 + np.random.normal(0, 0.2, len(df)))  # Random variation
+
+    target = (
+        df['area_hectares'].to_numpy()
+        * df['intensity_factor'].to_numpy(dtype=np.float64)
     )
-    
-    # Ensure positive values and reasonable bounds
-    df['co2_capture_tons_year'] = np.clip(df['co2_capture_tons_year'], 1, None)
-    
+    target *= base_co2_per_hectare
+    target *= 1 + 0.5 * df['technology_factor'].to_numpy(dtype=np.float64)  # Technology boost
+    target *= 1 + rng.normal(0, 0.2, n_samples)  # Random variation
+
+    # Ensure positive values and reasonable bounds; float32 is plenty of
+    # precision for a noisy synthetic target and halves its footprint
+    np.clip(target, 1, None, out=target)
+    df['co2_capture_tons_year'] = target.astype(np.float32, copy=False)
+
     return df
 
 
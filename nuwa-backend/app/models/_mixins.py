@@ -0,0 +1,48 @@
+"""
+Shared Model Mixins
+
+Column mixins and column types reused across the model modules.
+"""
+
+import types
+
+from sqlalchemy import Column, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
+
+# Shared read-only empty mapping handed out for absent JSON values, so
+# every "no metadata" row aliases one object instead of allocating a dict.
+# Not JSON-serializable: serializers must copy it to a plain dict before
+# emitting it (see User._build_dict).
+EMPTY_MAPPING = types.MappingProxyType({})
+
+class DefaultedJSON(TypeDecorator):
+    """JSONB column that stores NULL and reads back as a shared empty map.
+
+    Replaces default=dict columns: the callable default built a fresh
+    dict per insert even when callers had nothing to store, and loads of
+    NULL returned None that call sites then guarded against. With this
+    type, absent values cost no allocation on either side; the returned
+    mapping is immutable, so callers that want to populate it must assign
+    a real dict.
+    """
+    impl = JSONB
+    cache_ok = True
+
+    def process_result_value(self, value, dialect):
+        return value if value is not None else EMPTY_MAPPING
+
+class TimestampMixin:
+    """created_at / updated_at audit columns.
+
+    Declared once instead of per model: SQLAlchemy copies mixin columns
+    into each mapped class, so every model still gets its own Column
+    objects while import pays for a single definition. Centralizing the
+    pair also gives one place to later swap the timestamp source (e.g.
+    clock_timestamp() on Postgres or CURRENT_TIMESTAMP on SQLite).
+    Models that need extra options on a timestamp (such as an index)
+    override the column locally.
+    """
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -4,15 +4,24 @@ Geospatial Database Models
 SQLAlchemy models for geospatial data, satellite images, and geographic analysis.
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, Enum, ForeignKey, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    Column, Integer, SmallInteger, String, Text, DateTime, REAL, Boolean,
+    Enum, ForeignKey, Index, LargeBinary, event, text
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.sql import func
 from geoalchemy2 import Geometry, Raster
 import enum
+import numpy as np
+from operator import attrgetter
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 
 from app.core.database import Base
+from app.models._mixins import TimestampMixin, DefaultedJSON
+from app.models.serialization import cached_to_dict
 
 class DataSource(enum.Enum):
     """Satellite data source enumeration."""
@@ -33,7 +42,56 @@ class ProcessingStatus(enum.Enum):
     ANALYZED = "analyzed"
     FAILED = "failed"
 
-class GeospatialData(Base):
+class LandCover(enum.Enum):
+    """Dominant land cover classes."""
+    FOREST = "forest"
+    GRASSLAND = "grassland"
+    CROPLAND = "cropland"
+    WETLAND = "wetland"
+    URBAN = "urban"
+    WATER = "water"
+    BARE_SOIL = "bare_soil"
+    OTHER = "other"
+
+class ChangeType(enum.Enum):
+    """Detected land cover change types."""
+    DEFORESTATION = "deforestation"
+    GROWTH = "growth"
+    DEGRADATION = "degradation"
+    REGENERATION = "regeneration"
+    NO_CHANGE = "no_change"
+
+class ProcessingLevel(enum.Enum):
+    """Satellite product processing levels."""
+    L1C = "L1C"
+    L2A = "L2A"
+    L3 = "L3"
+
+class QualityRating(enum.Enum):
+    """Overall image quality ratings."""
+    EXCELLENT = "excellent"
+    GOOD = "good"
+    FAIR = "fair"
+    POOR = "poor"
+
+class StorageBase(Base):
+    """
+    Storage Base Model
+
+    Lookup table of normalized storage base URLs (bucket roots, CDN
+    hosts). Rows in geospatial_data keep only the object key plus a
+    2-byte reference here instead of repeating a ~400-byte URL prefix
+    per scene, which keeps the hot table dense.
+    """
+    __tablename__ = "storage_bases"
+
+    id = Column(SmallInteger, primary_key=True)
+    base_url = Column(Text, nullable=False, unique=True)
+
+    def __repr__(self):
+        return f"<StorageBase(id={self.id}, base_url='{self.base_url}')>"
+
+class GeospatialData(TimestampMixin, Base):
     """
     Geospatial Data Model
     
@@ -41,7 +99,22 @@ class GeospatialData(Base):
     including satellite imagery, vector data, and analysis results.
     """
     __tablename__ = "geospatial_data"
-    
+    __table_args__ = (
+        # SP-GiST partitions space into non-overlapping quadrants, which keeps
+        # the index shallower than GiST for the mostly non-overlapping scene
+        # footprints stored here and speeds up point-in-polygon lookups.
+        Index('ix_geospatial_data_geom_spgist', 'geometry', postgresql_using='spgist'),
+        # Composite index for the common "scenes of project X intersecting Y"
+        # pattern; requires the btree_gist extension for the integer column.
+        Index('ix_geospatial_data_project_geom', 'project_id', 'geometry',
+              postgresql_using='gist'),
+        # Scene timelines: latest acquisitions per project.
+        Index('ix_geospatial_data_project_date', 'project_id',
+              text('acquisition_date DESC')),
+        # Array containment lookups on band membership.
+        Index('ix_geo_bands_gin', 'spectral_bands', postgresql_using='gin'),
+    )
+
     # Primary identification
     id = Column(Integer, primary_key=True, index=True)
     
@@ -53,8 +126,8 @@ class GeospatialData(Base):
     description = Column(Text)
     data_type = Column(String(100))  # e.g., "raster", "vector", "point_cloud"
     
-    # Data source information
-    source = Column(Enum(DataSource), nullable=False)
+    # Data source information (indexed: primary list filter key)
+    source = Column(Enum(DataSource), nullable=False, index=True)
     source_id = Column(String(200))  # Original ID from data source
     
     # Temporal information
@@ -62,48 +135,76 @@ class GeospatialData(Base):
     processing_date = Column(DateTime)
     
     # Spatial information
-    geometry = Column(Geometry('GEOMETRY', srid=4326))  # Footprint or boundary
-    spatial_resolution_meters = Column(Float)
+    geometry = Column(Geometry('MULTIPOLYGON', srid=4326, spatial_index=False))  # Footprint or boundary
+    centroid = Column(Geometry('POINT', srid=4326, spatial_index=False))  # Precomputed footprint centroid
+    spatial_resolution_meters = Column(REAL)
     coordinate_system = Column(String(100), default="EPSG:4326")
     
-    # Raster data (for satellite imagery)
-    raster_data = Column(Raster)  # PostGIS raster support
-    
-    # File information
-    file_path = Column(String(500))
+    # File information (object key relative to storage_base; see StorageBase)
+    file_path = Column(String(200))
+    file_path_sha1 = Column(LargeBinary(20), unique=True)  # dedup lookup key
     file_size_bytes = Column(Integer)
     file_format = Column(String(50))  # e.g., "GeoTIFF", "NetCDF", "Shapefile"
     
-    # Processing status and metadata
-    processing_status = Column(Enum(ProcessingStatus), default=ProcessingStatus.RAW)
-    processing_parameters = Column(JSON, default=dict)
+    # Processing status
+    processing_status = Column(Enum(ProcessingStatus), default=ProcessingStatus.RAW, index=True)
     
     # Quality metrics
-    cloud_cover_percentage = Column(Float)
-    quality_score = Column(Float)  # 0-1 scale
-    
-    # Band/spectral information (for multispectral data)
-    spectral_bands = Column(JSON, default=list)  # List of band names/wavelengths
-    
-    # Analysis results
-    analysis_results = Column(JSON, default=dict)
+    cloud_cover_percentage = Column(REAL)
+    quality_score = Column(REAL)  # 0-1 scale
     
-    # Storage and access information
-    storage_location = Column(String(500))  # URL or path to stored data
-    access_url = Column(String(500))  # Public access URL if available
+    # Band/spectral information (for multispectral data). Native text array:
+    # band membership checks (.any('B8A')) hit the GIN index instead of
+    # scanning JSON.
+    spectral_bands = Column(ARRAY(Text), default=list)
     
-    # Metadata
-    metadata = Column(JSON, default=dict)
-    created_at = Column(DateTime, server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    # Storage and access information: object keys resolved against the
+    # shared base URL instead of full per-row URLs.
+    storage_base_id = Column(SmallInteger, ForeignKey('storage_bases.id'))
+    storage_location = Column(String(200))  # object key under storage_base
+    access_url = Column(String(200))  # public object key, if available
     
+    # created_at / updated_at come from TimestampMixin
+
+    # Columns serialized by to_dict(); list endpoints can pass these to
+    # load_only() so the SELECT matches the projection exactly.
+    SUMMARY_COLUMNS = (
+        "id", "project_id", "name", "description", "data_type", "source",
+        "acquisition_date", "processing_date", "spatial_resolution_meters",
+        "processing_status", "cloud_cover_percentage", "quality_score",
+        "file_format", "file_size_bytes", "created_at",
+    )
+    # attrgetter runs in C, avoiding a Python attribute lookup per key in
+    # the to_dict hot path.
+    _DICT_GETTER = attrgetter(*SUMMARY_COLUMNS)
+    _ENUM_KEYS = ("source", "processing_status")
+    _DATETIME_KEYS = ("acquisition_date", "processing_date", "created_at")
+
     # Relationships
     project = relationship("Project", back_populates="geospatial_data")
-    satellite_images = relationship("SatelliteImage", back_populates="geospatial_data", cascade="all, delete-orphan")
+    satellite_images = relationship("SatelliteImage", back_populates="geospatial_data",
+                                    cascade="all, delete-orphan", lazy="selectin")
+    blobs = relationship("GeospatialDataBlobs", back_populates="data",
+                         uselist=False, cascade="all, delete-orphan")
     
     def __repr__(self):
         return f"<GeospatialData(id={self.id}, name='{self.name}', source={self.source}, project_id={self.project_id})>"
     
+    @hybrid_property
+    def geometry_geojson(self):
+        """
+        GeoJSON text for the footprint, rendered by Postgres.
+
+        SELECT GeospatialData.geometry_geojson explicitly in list queries:
+        ST_AsGeoJSON returns ready-to-splice text, skipping the WKB decode
+        and Python re-encode the default geometry round trip would pay.
+        """
+        return None
+
+    @geometry_geojson.expression
+    def geometry_geojson(cls):
+        return func.ST_AsGeoJSON(cls.geometry)
+
     @property
     def is_processed(self) -> bool:
         """Check if data has been processed."""
@@ -118,25 +219,56 @@ class GeospatialData(Base):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert geospatial data to dictionary representation."""
-        return {
-            "id": self.id,
-            "project_id": self.project_id,
-            "name": self.name,
-            "description": self.description,
-            "data_type": self.data_type,
-            "source": self.source.value if self.source else None,
-            "acquisition_date": self.acquisition_date.isoformat() if self.acquisition_date else None,
-            "processing_date": self.processing_date.isoformat() if self.processing_date else None,
-            "spatial_resolution_meters": self.spatial_resolution_meters,
-            "processing_status": self.processing_status.value if self.processing_status else None,
-            "cloud_cover_percentage": self.cloud_cover_percentage,
-            "quality_score": self.quality_score,
-            "file_format": self.file_format,
-            "file_size_bytes": self.file_size_bytes,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-        }
+        return cached_to_dict(self.__tablename__, self.id, self.updated_at,
+                              self._build_dict)
+
+    def _build_dict(self) -> Dict[str, Any]:
+        d = dict(zip(self.SUMMARY_COLUMNS, self._DICT_GETTER(self)))
+        for key in self._ENUM_KEYS:
+            value = d[key]
+            d[key] = value.value if value else None
+        for key in self._DATETIME_KEYS:
+            value = d[key]
+            d[key] = value.isoformat() if value else None
+        return d
+
+class GeospatialDataBlobs(Base):
+    """
+    Geospatial Data Blobs Model
+
+    1:1 sibling table holding the TOAST-prone payloads (raster data and
+    large JSON blobs) split out of geospatial_data so sequential scans and
+    list queries over the hot scalar columns stay dense. Rows share their
+    primary key with the parent GeospatialData record.
+    """
+    __tablename__ = "geospatial_data_blobs"
+    __table_args__ = (
+        # GIN index for containment queries on analysis output
+        # (e.g. analysis_results @> '{"algorithm": "ndvi"}').
+        Index('ix_geospatial_blobs_analysis_gin', 'analysis_results',
+              postgresql_using='gin'),
+    )
+
+    # Shared primary key with geospatial_data
+    id = Column(Integer, ForeignKey('geospatial_data.id'), primary_key=True)
+
+    # Raster data (for satellite imagery)
+    raster_data = Column(Raster)  # PostGIS raster support
+
+    # Large JSON payloads
+    processing_parameters = Column(DefaultedJSON)
+    analysis_results = Column(DefaultedJSON)
+    # Mapped as extra_metadata to avoid shadowing Declarative's reserved
+    # Base.metadata attribute; the DB column name stays "metadata".
+    extra_metadata = Column('metadata', DefaultedJSON)
+
+    # Relationships
+    data = relationship("GeospatialData", back_populates="blobs")
+
+    def __repr__(self):
+        return f"<GeospatialDataBlobs(id={self.id})>"
 
-class SatelliteImage(Base):
+class SatelliteImage(TimestampMixin, Base):
     """
     Satellite Image Model
     
@@ -144,7 +276,15 @@ class SatelliteImage(Base):
     processing information for vegetation and carbon analysis.
     """
     __tablename__ = "satellite_images"
-    
+    __table_args__ = (
+        # GIN index so land cover filters can use JSONB containment.
+        Index('ix_satimg_land_cover_gin', 'land_cover_classes',
+              postgresql_using='gin'),
+        # Partial index: change dashboards only ever look at detected rows.
+        Index('ix_satimg_change', 'change_type',
+              postgresql_where=text('change_detected IS TRUE')),
+    )
+
     # Primary identification
     id = Column(Integer, primary_key=True, index=True)
     
@@ -161,52 +301,67 @@ class SatelliteImage(Base):
     product_id = Column(String(200))
     
     # Acquisition details
-    sun_elevation_angle = Column(Float)
-    sun_azimuth_angle = Column(Float)
-    view_angle = Column(Float)
+    sun_elevation_angle = Column(REAL)
+    sun_azimuth_angle = Column(REAL)
+    view_angle = Column(REAL)
     
     # Atmospheric conditions
     atmospheric_correction = Column(Boolean, default=False)
-    atmospheric_parameters = Column(JSON, default=dict)
+    atmospheric_parameters = deferred(Column(DefaultedJSON))
     
     # Spectral indices (calculated from bands)
-    ndvi = Column(Float)          # Normalized Difference Vegetation Index
-    evi = Column(Float)           # Enhanced Vegetation Index  
-    ndwi = Column(Float)          # Normalized Difference Water Index
-    nbr = Column(Float)           # Normalized Burn Ratio
-    savi = Column(Float)          # Soil-Adjusted Vegetation Index
+    ndvi = Column(REAL)          # Normalized Difference Vegetation Index
+    evi = Column(REAL)           # Enhanced Vegetation Index  
+    ndwi = Column(REAL)          # Normalized Difference Water Index
+    nbr = Column(REAL)           # Normalized Burn Ratio
+    savi = Column(REAL)          # Soil-Adjusted Vegetation Index
     
     # Land cover classification results
-    land_cover_classes = Column(JSON, default=dict)  # Percentage of each class
-    dominant_land_cover = Column(String(100))
+    land_cover_classes = deferred(Column(DefaultedJSON))  # Percentage of each class
+    dominant_land_cover = Column(Enum(LandCover))  # 4-byte enum instead of free text
     
     # Vegetation analysis results
-    vegetation_cover_percentage = Column(Float)
-    biomass_estimate_tons_per_hectare = Column(Float)
-    leaf_area_index = Column(Float)
+    vegetation_cover_percentage = Column(REAL)
+    # Materialized from ndvi by the before_insert/before_update hooks below
+    # so dashboards can filter and sort on it with an index.
+    vegetation_health_score = Column(REAL, index=True)
+    biomass_estimate_tons_per_hectare = Column(REAL)
+    leaf_area_index = Column(REAL)
     
     # Change detection (compared to previous images)
     change_detected = Column(Boolean)
-    change_type = Column(String(100))  # e.g., "deforestation", "growth", "degradation"
-    change_magnitude = Column(Float)
+    change_type = Column(Enum(ChangeType))
+    change_magnitude = Column(REAL)
     
     # Processing information
-    processing_level = Column(String(20))  # e.g., "L1C", "L2A", "L3"
+    processing_level = Column(Enum(ProcessingLevel))
     processing_date = Column(DateTime)
     processing_software = Column(String(100))
     
     # Analysis parameters
-    analysis_algorithms = Column(JSON, default=list)
-    algorithm_versions = Column(JSON, default=dict)
+    analysis_algorithms = deferred(Column(JSONB, default=list))
+    algorithm_versions = deferred(Column(DefaultedJSON))
     
     # Quality assessment
-    overall_quality = Column(String(50))  # e.g., "excellent", "good", "fair", "poor"
-    quality_flags = Column(JSON, default=list)
-    
-    # Metadata
-    created_at = Column(DateTime, server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    overall_quality = Column(Enum(QualityRating))
+    quality_flags = deferred(Column(JSONB, default=list))
     
+    # created_at / updated_at come from TimestampMixin
+
+    # Columns serialized by to_dict(); see GeospatialData.SUMMARY_COLUMNS.
+    SUMMARY_COLUMNS = (
+        "id", "geospatial_data_id", "satellite_name", "sensor_type",
+        "scene_id", "orbit_number", "sun_elevation_angle",
+        "atmospheric_correction", "ndvi", "evi", "ndwi",
+        "vegetation_cover_percentage", "biomass_estimate_tons_per_hectare",
+        "change_detected", "change_type", "processing_level",
+        "overall_quality", "vegetation_health_score", "created_at",
+    )
+    # See GeospatialData._DICT_GETTER.
+    _DICT_GETTER = attrgetter(*SUMMARY_COLUMNS)
+    _ENUM_KEYS = ("change_type", "processing_level", "overall_quality")
+    _DATETIME_KEYS = ("created_at",)
+
     # Relationships
     geospatial_data = relationship("GeospatialData", back_populates="satellite_images")
     
@@ -218,86 +373,187 @@ class SatelliteImage(Base):
         """Check if vegetation indices are calculated."""
         return any([self.ndvi, self.evi, self.savi])
     
-    @property
-    def vegetation_health_score(self) -> Optional[float]:
-        """Calculate vegetation health score based on indices (0-1 scale)."""
-        if not self.ndvi:
+    # NDVI thresholds and the health score for each resulting bucket.
+    # NDVI ranges from -1 to 1, healthy vegetation typically > 0.3.
+    _HEALTH_BUCKETS = np.array([0.1, 0.3, 0.5, 0.7])
+    _HEALTH_SCORES = np.array([0.2, 0.4, 0.6, 0.8, 1.0])
+
+    @classmethod
+    def score_ndvi(cls, ndvi: Optional[float]) -> Optional[float]:
+        """Vegetation health score for one NDVI value (0-1 scale)."""
+        if not ndvi:
             return None
-        
-        # Simple health score based on NDVI
-        # NDVI ranges from -1 to 1, healthy vegetation typically > 0.3
-        if self.ndvi >= 0.7:
-            return 1.0
-        elif self.ndvi >= 0.5:
-            return 0.8
-        elif self.ndvi >= 0.3:
-            return 0.6
-        elif self.ndvi >= 0.1:
-            return 0.4
-        else:
-            return 0.2
-    
-    def calculate_spectral_indices(self, red: float, nir: float, blue: float = None, swir: float = None) -> Dict[str, float]:
+
+        # Bucket lookup instead of a comparison ladder
+        return float(cls._HEALTH_SCORES[
+            np.searchsorted(cls._HEALTH_BUCKETS, ndvi, side='right')
+        ])
+
+    @classmethod
+    def batch_vegetation_health_score(cls, ndvi_values) -> np.ndarray:
+        """
+        Vectorized vegetation health score for an array of NDVI values.
+
+        Returns a float array with NaN where NDVI is missing (NaN or 0),
+        mirroring the None returned by scalar score_ndvi().
+        """
+        ndvi = np.asarray(ndvi_values, dtype=np.float64)
+        missing = np.isnan(ndvi) | (ndvi == 0)
+        buckets = np.searchsorted(cls._HEALTH_BUCKETS,
+                                  np.where(missing, 0.0, ndvi), side='right')
+        return np.where(missing, np.nan, cls._HEALTH_SCORES[buckets])
+    
+    def calculate_spectral_indices(self, red, nir, blue=None, swir=None) -> Dict[str, Any]:
         """
         Calculate spectral indices from band values.
-        
+
+        Accepts scalars or NumPy arrays (e.g. whole raster bands); array
+        inputs are processed element-wise in single vectorized passes with
+        zero denominators yielding NaN instead of raising.
+
         Args:
-            red: Red band reflectance (0-1)
-            nir: Near-infrared band reflectance (0-1) 
+            red: Red band reflectance (0-1), scalar or array
+            nir: Near-infrared band reflectance (0-1), scalar or array
             blue: Blue band reflectance (0-1), optional
             swir: Short-wave infrared reflectance (0-1), optional
-            
+
         Returns:
-            Dictionary of calculated indices
+            Dictionary of calculated indices (scalars for scalar input,
+            arrays for array input)
         """
-        indices = {}
-        
-        # NDVI: (NIR - Red) / (NIR + Red)
-        if nir is not None and red is not None:
-            denominator = nir + red
-            if denominator != 0:
-                indices['ndvi'] = (nir - red) / denominator
-        
+        scalar_input = np.isscalar(red) and np.isscalar(nir)
+        red = np.asarray(red, dtype=np.float64)
+        nir = np.asarray(nir, dtype=np.float64)
+        diff = nir - red
+
+        def safe_divide(numerator, denominator):
+            result = np.full(np.broadcast(numerator, denominator).shape, np.nan)
+            np.divide(numerator, denominator, out=result, where=denominator != 0)
+            return result
+
+        indices = {
+            # NDVI: (NIR - Red) / (NIR + Red)
+            'ndvi': safe_divide(diff, nir + red),
+            # SAVI: ((NIR - Red) / (NIR + Red + 0.5)) * 1.5
+            'savi': safe_divide(diff, nir + red + 0.5) * 1.5,
+        }
+
         # EVI: 2.5 * ((NIR - Red) / (NIR + 6*Red - 7.5*Blue + 1))
-        if nir is not None and red is not None and blue is not None:
-            denominator = nir + 6*red - 7.5*blue + 1
-            if denominator != 0:
-                indices['evi'] = 2.5 * ((nir - red) / denominator)
-        
-        # SAVI: ((NIR - Red) / (NIR + Red + 0.5)) * 1.5
-        if nir is not None and red is not None:
-            denominator = nir + red + 0.5
-            if denominator != 0:
-                indices['savi'] = ((nir - red) / denominator) * 1.5
-        
+        if blue is not None:
+            blue = np.asarray(blue, dtype=np.float64)
+            indices['evi'] = 2.5 * safe_divide(diff, nir + 6*red - 7.5*blue + 1)
+
         # NBR: (NIR - SWIR) / (NIR + SWIR)
-        if nir is not None and swir is not None:
-            denominator = nir + swir
-            if denominator != 0:
-                indices['nbr'] = (nir - swir) / denominator
-        
+        if swir is not None:
+            swir = np.asarray(swir, dtype=np.float64)
+            indices['nbr'] = safe_divide(nir - swir, nir + swir)
+
+        if scalar_input:
+            indices = {name: float(value) for name, value in indices.items()
+                       if not np.isnan(value)}
         return indices
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert satellite image to dictionary representation."""
-        return {
-            "id": self.id,
-            "geospatial_data_id": self.geospatial_data_id,
-            "satellite_name": self.satellite_name,
-            "sensor_type": self.sensor_type,
-            "scene_id": self.scene_id,
-            "orbit_number": self.orbit_number,
-            "sun_elevation_angle": self.sun_elevation_angle,
-            "atmospheric_correction": self.atmospheric_correction,
-            "ndvi": self.ndvi,
-            "evi": self.evi,
-            "ndwi": self.ndwi,
-            "vegetation_cover_percentage": self.vegetation_cover_percentage,
-            "biomass_estimate_tons_per_hectare": self.biomass_estimate_tons_per_hectare,
-            "change_detected": self.change_detected,
-            "change_type": self.change_type,
-            "processing_level": self.processing_level,
-            "overall_quality": self.overall_quality,
-            "vegetation_health_score": self.vegetation_health_score,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-        }
\ No newline at end of file
+        return cached_to_dict(self.__tablename__, self.id, self.updated_at,
+                              self._build_dict)
+
+    def _build_dict(self) -> Dict[str, Any]:
+        d = dict(zip(self.SUMMARY_COLUMNS, self._DICT_GETTER(self)))
+        for key in self._ENUM_KEYS:
+            value = d[key]
+            d[key] = value.value if value else None
+        for key in self._DATETIME_KEYS:
+            value = d[key]
+            d[key] = value.isoformat() if value else None
+        return d
+
+    @classmethod
+    def bulk_to_dicts(cls, images: List["SatelliteImage"]) -> List[Dict[str, Any]]:
+        """
+        Serialize many images with one compiled getter instead of a
+        per-row dict literal; the conversions run over local bindings.
+        """
+        getter = cls._DICT_GETTER
+        keys = cls.SUMMARY_COLUMNS
+        enum_keys = cls._ENUM_KEYS
+        dt_keys = cls._DATETIME_KEYS
+        results = []
+        for image in images:
+            d = dict(zip(keys, getter(image)))
+            for key in enum_keys:
+                value = d[key]
+                d[key] = value.value if value else None
+            for key in dt_keys:
+                value = d[key]
+                d[key] = value.isoformat() if value else None
+            results.append(d)
+        return results
+@event.listens_for(SatelliteImage, 'before_insert')
+@event.listens_for(SatelliteImage, 'before_update')
+def _materialize_vegetation_health_score(mapper, connection, target):
+    """Keep the stored vegetation_health_score in sync with ndvi."""
+    target.vegetation_health_score = SatelliteImage.score_ndvi(target.ndvi)
+
+# Bulk ingestion helpers
+#
+# Inserting scenes one at a time through session.add() runs GeoAlchemy2's
+# per-row type coercion and a round trip per scene. These helpers push whole
+# batches through Core executemany; the geometry variant uses raw SQL because
+# bulk mappings bypass GeoAlchemy2 and would leave the geometry column empty.
+
+_SCENE_INSERT_SQL = text("""
+    INSERT INTO geospatial_data
+        (project_id, name, description, data_type, source, source_id,
+         acquisition_date, spatial_resolution_meters, file_format, geometry)
+    VALUES
+        (:project_id, :name, :description, :data_type, :source, :source_id,
+         :acquisition_date, :spatial_resolution_meters, :file_format,
+         ST_SetSRID(ST_GeomFromWKB(:wkb), 4326))
+""")
+
+def bulk_insert_scenes(session, rows: List[Dict[str, Any]]) -> None:
+    """
+    Insert many GeospatialData scenes in a single executemany round trip.
+
+    Each row dict must carry the keys named in the INSERT above, with 'wkb'
+    holding the footprint encoded as WKB bytes (e.g. shapely's
+    geometry.wkb). Runs inside the caller's transaction.
+    """
+    if rows:
+        session.execute(_SCENE_INSERT_SQL, rows)
+
+def bulk_insert_satellite_images(session, rows: List[Dict[str, Any]]) -> None:
+    """
+    Insert many SatelliteImage rows via Core executemany.
+
+    No geometry column here, so the plain table insert is safe and avoids
+    ORM unit-of-work overhead entirely. Core inserts skip ORM events, so
+    the materialized vegetation_health_score is filled in here.
+    """
+    if rows:
+        for row in rows:
+            if 'vegetation_health_score' not in row:
+                row['vegetation_health_score'] = SatelliteImage.score_ndvi(row.get('ndvi'))
+        session.execute(SatelliteImage.__table__.insert(), rows)
+
+async def copy_satellite_images(session, records, columns) -> None:
+    """
+    Stream SatelliteImage rows into Postgres with binary COPY.
+
+    executemany still pays one round trip per row batch; for whole
+    satellite passes (hundreds of thousands of rows) asyncpg's
+    copy_records_to_table moves the bottleneck from the network to disk.
+    `records` is an iterable of tuples ordered like `columns`; include
+    vegetation_health_score explicitly (COPY bypasses ORM events — use
+    SatelliteImage.batch_vegetation_health_score to fill it). Scenes with
+    geometry stay on bulk_insert_scenes, which routes WKB through
+    ST_GeomFromWKB.
+    """
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        SatelliteImage.__tablename__,
+        records=records,
+        columns=list(columns),
+    )
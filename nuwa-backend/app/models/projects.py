@@ -4,16 +4,20 @@ Project Database Models
 SQLAlchemy models for carbon capture projects and related entities.
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, Enum, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, Enum, ForeignKey, JSON, Index, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import ARRAY
 from geoalchemy2 import Geometry
 import enum
 from datetime import datetime
 from typing import Optional, Dict, Any
 
 from app.core.database import Base
+from app.models._mixins import TimestampMixin, DefaultedJSON
+from app.models.serialization import cached_to_dict
 
 class ProjectStatus(enum.Enum):
     """Project status enumeration."""
@@ -40,7 +44,7 @@ class ProjectType(enum.Enum):
     BIOMASS_ENERGY = "biomass_energy"
     OTHER = "other"
 
-class Project(Base):
+class Project(TimestampMixin, Base):
     """
     Carbon Capture Project Model
     
@@ -48,23 +52,31 @@ class Project(Base):
     metadata, location information, and evaluation parameters.
     """
     __tablename__ = "projects"
-    
+    __table_args__ = (
+        # Dashboard listings filter by country and status together.
+        Index('ix_projects_country_status', 'country', 'status'),
+        # Array containment lookups on planted species.
+        Index('ix_projects_species_gin', 'species_planted', postgresql_using='gin'),
+        # Spatial filters on the boundary ("projects intersecting X").
+        Index('ix_projects_boundary_gist', 'boundary_geom', postgresql_using='gist'),
+    )
+
     # Primary identification
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(200), nullable=False, index=True)
     description = Column(Text)
     
-    # Project classification
-    project_type = Column(Enum(ProjectType), nullable=False)
-    status = Column(Enum(ProjectStatus), default=ProjectStatus.DRAFT, nullable=False)
+    # Project classification (indexed: primary list/search filter keys)
+    project_type = Column(Enum(ProjectType), nullable=False, index=True)
+    status = Column(Enum(ProjectStatus), default=ProjectStatus.DRAFT, nullable=False, index=True)
     
     # Location and boundaries
     # Store project boundaries as polygon geometry (WGS84)
-    boundary_geom = Column(Geometry('POLYGON', srid=4326))
+    boundary_geom = Column(Geometry('POLYGON', srid=4326, spatial_index=False))
     
     # Location details
-    country = Column(String(100))
-    region = Column(String(100)) 
+    country = Column(String(100), index=True)
+    region = Column(String(100))
     locality = Column(String(100))
     
     # Coordinates for center point
@@ -93,8 +105,9 @@ class Project(Base):
     estimated_cost_usd = Column(Float)
     revenue_model = Column(Text)
     
-    # Technical specifications
-    species_planted = Column(JSON)  # For forestry projects
+    # Technical specifications. species_planted is a native text array so
+    # species containment filters can use the GIN index below.
+    species_planted = Column(ARRAY(Text))  # For forestry projects
     soil_types = Column(JSON)
     climate_zone = Column(String(100))
     average_rainfall_mm = Column(Float)
@@ -109,16 +122,15 @@ class Project(Base):
     monitoring_plan = Column(Text)
     verification_schedule = Column(JSON)
     
-    # Metadata
-    created_at = Column(DateTime, server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    # created_at / updated_at come from TimestampMixin
     
     # User relationships (to be implemented)
     # created_by = Column(Integer, ForeignKey('users.id'))
     # owner_id = Column(Integer, ForeignKey('users.id'))
     
-    # Additional project metadata
-    metadata = Column(JSON, default=dict)
+    # Additional project metadata (column name stays "metadata"; the Python
+    # attribute is renamed to avoid clashing with Declarative's Base.metadata)
+    extra_metadata = Column('metadata', DefaultedJSON)
     
     # Validation flags
     is_validated = Column(Boolean, default=False)
@@ -131,6 +143,21 @@ class Project(Base):
     def __repr__(self):
         return f"<Project(id={self.id}, name='{self.name}', type={self.project_type}, status={self.status})>"
     
+    @hybrid_property
+    def boundary_geojson(self):
+        """
+        GeoJSON text for the boundary, rendered by Postgres.
+
+        SELECT Project.boundary_geojson explicitly when responses need
+        GeoJSON; ST_AsGeoJSON returns text ready to splice into the
+        payload without decoding WKB in Python first.
+        """
+        return None
+
+    @boundary_geojson.expression
+    def boundary_geojson(cls):
+        return func.ST_AsGeoJSON(cls.boundary_geom)
+
     @property
     def area_sqkm(self) -> Optional[float]:
         """Calculate project area in square kilometers."""
@@ -157,6 +184,10 @@ class Project(Base):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert project to dictionary representation."""
+        return cached_to_dict(self.__tablename__, self.id, self.updated_at,
+                              self._build_dict)
+
+    def _build_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
             "name": self.name,
@@ -181,4 +212,48 @@ class Project(Base):
             "is_validated": self.is_validated,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
\ No newline at end of file
+        }
+
+class ProjectBoundaryPart(Base):
+    """
+    Project Boundary Part Model
+
+    Subdivided pieces of a project's boundary polygon. Whole-region
+    boundaries have loose bounding boxes that produce many false positives
+    in spatial index probes; subdividing to small pieces gives the index
+    tight boxes and much faster point-in-polygon joins. Rows are rebuilt
+    from projects.boundary_geom via refresh_boundary_parts().
+    """
+    __tablename__ = "project_boundary_parts"
+    __table_args__ = (
+        Index('ix_project_boundary_parts_geom', 'geom', postgresql_using='gist'),
+    )
+
+    id = Column(Integer, primary_key=True)
+    project_id = Column(Integer, ForeignKey('projects.id', ondelete='CASCADE'),
+                        nullable=False, index=True)
+    geom = Column(Geometry('POLYGON', srid=4326, spatial_index=False))
+
+    def __repr__(self):
+        return f"<ProjectBoundaryPart(id={self.id}, project_id={self.project_id})>"
+
+# Rebuild statements for the subdivided boundary cache. 256 vertices per
+# piece keeps each bbox tight without exploding the row count.
+_BOUNDARY_PARTS_DELETE_SQL = text(
+    "DELETE FROM project_boundary_parts WHERE project_id = :project_id"
+)
+_BOUNDARY_PARTS_INSERT_SQL = text("""
+    INSERT INTO project_boundary_parts (project_id, geom)
+    SELECT id, (ST_Dump(ST_Subdivide(boundary_geom, 256))).geom
+    FROM projects
+    WHERE id = :project_id AND boundary_geom IS NOT NULL
+""")
+
+async def refresh_boundary_parts(session, project_id: int) -> None:
+    """
+    Rebuild the subdivided boundary pieces for one project.
+
+    Call after boundary_geom changes, inside the caller's transaction.
+    """
+    await session.execute(_BOUNDARY_PARTS_DELETE_SQL, {"project_id": project_id})
+    await session.execute(_BOUNDARY_PARTS_INSERT_SQL, {"project_id": project_id})
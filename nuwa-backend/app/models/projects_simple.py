@@ -111,8 +111,9 @@ class Project(Base):
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
     
-    # Additional project metadata
-    metadata = Column(JSON, default=dict)
+    # Additional project metadata (column name stays "metadata"; the Python
+    # attribute is renamed to avoid clashing with Declarative's Base.metadata)
+    extra_metadata = Column('metadata', JSON, default=dict)
     
     # Validation flags
     is_validated = Column(Boolean, default=False)
@@ -4,15 +4,99 @@ SQLite Project Database Models
 SQLAlchemy models for carbon capture projects using SQLite.
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, Enum, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, Enum, ForeignKey, JSON, Index, LargeBinary, text, select
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates, load_only
 from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
+import bisect
 import enum
+import msgpack
+import orjson
+import sys
 from datetime import datetime
+from functools import cached_property
 from typing import Optional, Dict, Any
 
 from app.core.database_sqlite import Base
+from app.models._mixins import TimestampMixin
+
+# co2_efficiency_rating lookup: bisect_right into the sorted thresholds
+# picks the label in one C-level binary search instead of a Python
+# comparison ladder per evaluation (>= 10 excellent, >= 7 good, >= 4
+# average, >= 2 below_average, else poor).
+_RATING_THRESHOLDS = (2, 4, 7, 10)
+_RATING_LABELS = ("poor", "below_average", "average", "good", "excellent")
+
+class MsgPackType(TypeDecorator):
+    """Opaque structured blob stored as MessagePack.
+
+    For columns only ever read back by Python (never addressed with SQL
+    json path expressions), MessagePack is ~30-50% smaller than JSON text
+    and decodes faster. Values round-trip losslessly; keep SQL-queryable
+    columns on JSON instead.
+    """
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else msgpack.packb(value, use_bin_type=True)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else msgpack.unpackb(value, raw=False)
+
+class InternedString(TypeDecorator):
+    """String column whose loaded values are interned.
+
+    status / project_type / confidence_level hold a handful of distinct
+    values repeated across every row; interning makes each result set
+    share one str object per value, and equality checks against the
+    interned constants below short-circuit on the pointer comparison.
+    """
+    impl = String
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return sys.intern(value) if value is not None else None
+
+    def process_result_value(self, value, dialect):
+        return sys.intern(value) if value is not None else None
+
+def _compile_to_dict(fields, datetime_fields=(), prelude=(), derived=(),
+                     namespace=None, doc=None):
+    """Generate a specialized to_dict function at import time.
+
+    Builds source code that reads every exported column out of __dict__
+    in one pass and execs it once, so the per-call bytecode is a single
+    dict display over local loads — no instrumented attribute access, no
+    generic loop. prelude lines bind locals (datetime columns and derived
+    inputs); derived maps extra keys to expressions over those locals.
+    """
+    lines = ["def to_dict(self):", "    get = self.__dict__.get"]
+    for name in datetime_fields:
+        lines.append(f"    {name} = get('{name}')")
+    lines.extend(f"    {line}" for line in prelude)
+    lines.append("    return {")
+    for name in fields:
+        if name in datetime_fields:
+            lines.append(
+                f"        '{name}': {name}.isoformat() if {name} else None,")
+        else:
+            lines.append(f"        '{name}': get('{name}'),")
+    for name, expression in derived:
+        lines.append(f"        '{name}': {expression},")
+    lines.append("    }")
+    scope = dict(namespace or {})
+    exec("\n".join(lines), scope)
+    function = scope["to_dict"]
+    function.__doc__ = doc
+    return function
+
+# Interned comparison constants for the hot derived properties.
+_ACTIVE = sys.intern("active")
+_COMPLETED = sys.intern("completed")
+_HIGH = sys.intern("high")
+_VERY_HIGH = sys.intern("very_high")
 
 class ProjectStatus(enum.Enum):
     """Project status enumeration."""
@@ -39,7 +123,13 @@ class ProjectType(enum.Enum):
     BIOMASS_ENERGY = "biomass_energy"
     OTHER = "other"
 
-class Project(Base):
+# Intern every allowed status/type value once so InternedString result
+# values resolve to these exact objects.
+for _member in (*ProjectStatus, *ProjectType):
+    sys.intern(_member.value)
+del _member
+
+class Project(TimestampMixin, Base):
     """
     Carbon Capture Project Model for SQLite
     
@@ -47,18 +137,22 @@ class Project(Base):
     metadata, location information, and evaluation parameters.
     """
     __tablename__ = "projects"
-    
+    __table_args__ = (
+        # List endpoints filter by status and type together.
+        Index('ix_projects_status_type', 'status', 'project_type'),
+    )
+
     # Primary identification
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(200), nullable=False, index=True)
     description = Column(Text)
-    
-    # Project classification
-    project_type = Column(String(50), nullable=False)  # Store as string for SQLite
-    status = Column(String(50), default="draft", nullable=False)  # Store as string for SQLite
-    
+
+    # Project classification (indexed: primary list filter keys)
+    project_type = Column(InternedString(50), nullable=False, index=True)  # Store as string for SQLite
+    status = Column(InternedString(50), default="draft", nullable=False, index=True)  # Store as string for SQLite
+
     # Location details
-    country = Column(String(100))
+    country = Column(String(100), index=True)
     region = Column(String(100)) 
     locality = Column(String(100))
     
@@ -67,7 +161,7 @@ class Project(Base):
     longitude = Column(Float)
     
     # Store boundary as JSON (simplified approach)
-    boundary_geojson = Column(Text)  # Store as TEXT in SQLite
+    boundary_geojson = Column(JSON)
     
     # Area and scale
     total_area_hectares = Column(Float)
@@ -91,9 +185,10 @@ class Project(Base):
     estimated_cost_usd = Column(Float)
     revenue_model = Column(Text)
     
-    # Technical specifications (stored as JSON text)
-    species_planted = Column(Text)  # JSON as TEXT for SQLite
-    soil_types = Column(Text)       # JSON as TEXT for SQLite
+    # Technical specifications (native JSON: json1 parses once at the
+    # engine boundary instead of every Python-side read)
+    species_planted = Column(JSON)
+    soil_types = Column(JSON)
     climate_zone = Column(String(100))
     average_rainfall_mm = Column(Float)
     average_temperature_c = Column(Float)
@@ -105,14 +200,14 @@ class Project(Base):
     
     # Verification and monitoring
     monitoring_plan = Column(Text)
-    verification_schedule = Column(Text)  # JSON as TEXT for SQLite
-    
-    # Metadata
-    created_at = Column(DateTime, server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    verification_schedule = Column(MsgPackType)
     
+    # updated_at comes from TimestampMixin; created_at is overridden to
+    # add the index newest-first listings rely on.
+    created_at = Column(DateTime, server_default=func.now(), nullable=False, index=True)
+
     # Additional project metadata
-    project_metadata = Column(Text)  # JSON as TEXT for SQLite (renamed to avoid conflict)
+    project_metadata = Column(MsgPackType)  # renamed to avoid conflict
     
     # Validation flags
     is_validated = Column(Boolean, default=False)
@@ -120,89 +215,132 @@ class Project(Base):
     
     # Relationships will be defined when evaluation models are created
     # evaluations = relationship("Evaluation", back_populates="project", cascade="all, delete-orphan")
-    
+
+    # Columns list views actually serialize (the full to_dict key set).
+    # The wide TEXT/JSON blobs — boundary_geojson, baseline_scenario,
+    # monitoring_plan, verification_schedule, project_metadata — are left
+    # out so list queries never fetch or materialize them.
+    LIST_COLUMNS = (
+        "id", "name", "description", "project_type", "status",
+        "country", "region", "locality", "latitude", "longitude",
+        "total_area_hectares", "project_area_hectares",
+        "start_date", "end_date",
+        "estimated_co2_capture_tons_year", "total_estimated_co2_tons",
+        "methodology", "standard", "estimated_cost_usd", "climate_zone",
+        "is_validated", "created_at", "updated_at",
+    )
+
+    @classmethod
+    def query_for_list(cls):
+        """Base select for list endpoints, loading only LIST_COLUMNS."""
+        return select(cls).options(
+            load_only(*(getattr(cls, name) for name in cls.LIST_COLUMNS))
+        )
+
+    @classmethod
+    async def stream_all(cls, session, batch: int = 1000):
+        """Yield every row as an orjson-encoded NDJSON line.
+
+        Streams through a server-side cursor in yield_per batches, so an
+        export holds at most one batch of ORM objects in memory instead
+        of materializing the whole table. Feed straight into a
+        StreamingResponse with media type application/x-ndjson.
+        """
+        result = await session.stream(
+            cls.query_for_list().execution_options(
+                yield_per=batch, stream_results=True
+            )
+        )
+        async for row in result.scalars():
+            yield orjson.dumps(row.to_dict()) + b"\n"
+
+    # Class-level repr template: format_map reuses the parsed template
+    # and reads straight from __dict__, where f-strings re-run attribute
+    # access per call. Matters when debug logging reprs whole result sets.
+    _REPR = "<Project(id={id}, name='{name}', type={project_type}, status={status})>"
+
     def __repr__(self):
-        return f"<Project(id={self.id}, name='{self.name}', type={self.project_type}, status={self.status})>"
-    
-    @property
+        try:
+            return self._REPR.format_map(self.__dict__)
+        except KeyError:
+            # Expired or projection-loaded instance: fall back to
+            # attribute access, which loads the missing values like the
+            # original f-string did. repr must never raise.
+            return (f"<Project(id={self.id}, name='{self.name}', "
+                    f"type={self.project_type}, status={self.status})>")
+    
+    # Derived values are memoized with cached_property: serialization
+    # layers tend to touch each one several times per row, and ORM
+    # instances have a writable __dict__ for the cache to live in. The
+    # @validates hook below drops stale entries when an input changes.
+    @cached_property
     def area_sqkm(self) -> Optional[float]:
         """Calculate project area in square kilometers."""
         if self.project_area_hectares:
             return self.project_area_hectares / 100
         return None
-    
-    @property
+
+    @cached_property
     def is_active(self) -> bool:
         """Check if project is currently active."""
-        return self.status == "active"
-    
-    @property
+        return self.status == _ACTIVE
+
+    @cached_property
     def is_completed(self) -> bool:
         """Check if project is completed."""
-        return self.status == "completed"
-    
-    @property
+        return self.status == _COMPLETED
+
+    @cached_property
     def co2_capture_rate_per_hectare(self) -> Optional[float]:
         """Calculate CO2 capture rate per hectare per year."""
         if self.estimated_co2_capture_tons_year and self.project_area_hectares:
             return self.estimated_co2_capture_tons_year / self.project_area_hectares
         return None
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert project to dictionary representation."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "description": self.description,
-            "project_type": self.project_type,
-            "status": self.status,
-            "country": self.country,
-            "region": self.region,
-            "locality": self.locality,
-            "latitude": self.latitude,
-            "longitude": self.longitude,
-            "total_area_hectares": self.total_area_hectares,
-            "project_area_hectares": self.project_area_hectares,
-            "start_date": self.start_date.isoformat() if self.start_date else None,
-            "end_date": self.end_date.isoformat() if self.end_date else None,
-            "estimated_co2_capture_tons_year": self.estimated_co2_capture_tons_year,
-            "total_estimated_co2_tons": self.total_estimated_co2_tons,
-            "methodology": self.methodology,
-            "standard": self.standard,
-            "estimated_cost_usd": self.estimated_cost_usd,
-            "climate_zone": self.climate_zone,
-            "is_validated": self.is_validated,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "area_sqkm": self.area_sqkm,
-            "co2_capture_rate_per_hectare": self.co2_capture_rate_per_hectare,
-        }
-
-class Evaluation(Base):
+
+    @validates("status", "project_area_hectares", "estimated_co2_capture_tons_year")
+    def _invalidate_cached(self, key, value):
+        """Drop memoized derived values when one of their inputs changes."""
+        for cached in ("area_sqkm", "is_active", "is_completed",
+                       "co2_capture_rate_per_hectare"):
+            self.__dict__.pop(cached, None)
+        return value
+
+    # to_dict is generated from LIST_COLUMNS at the bottom of the module.
+
+class Evaluation(TimestampMixin, Base):
     """
     Project Evaluation Model for SQLite
     
     Represents an evaluation/assessment of a carbon capture project.
     """
     __tablename__ = "evaluations"
-    
+    __table_args__ = (
+        # Per-project evaluation timelines.
+        Index('ix_evaluations_project_date', 'project_id', 'evaluation_date'),
+        # Expression index on the model name inside detailed_results, so
+        # filters on json_extract(detailed_results, '$.model') use a BTree
+        # lookup instead of parsing the JSON blob for every row.
+        Index('ix_evaluations_results_model',
+              text("json_extract(detailed_results, '$.model')")),
+    )
+
     # Primary identification
     id = Column(Integer, primary_key=True, index=True)
-    
+
     # Project relationship
     project_id = Column(Integer, ForeignKey('projects.id'), nullable=False)
-    
-    # Evaluation metadata
-    evaluation_type = Column(String(50), nullable=False)  # baseline, monitoring, verification, etc.
-    status = Column(String(50), default="pending", nullable=False)
-    
+
+    # Evaluation metadata (indexed: primary list filter keys)
+    evaluation_type = Column(InternedString(50), nullable=False, index=True)  # baseline, monitoring, verification, etc.
+    status = Column(InternedString(50), default="pending", nullable=False, index=True)
+
     # Timeline
-    evaluation_date = Column(DateTime, nullable=False)
+    evaluation_date = Column(DateTime, nullable=False, index=True)
     period_start = Column(DateTime)
     period_end = Column(DateTime)
     
     # Data sources used (stored as JSON text)
-    satellite_data_sources = Column(Text)  # JSON array as TEXT
+    satellite_data_sources = Column(JSON)  # JSON array
     ground_truth_data = Column(Boolean, default=False)
     field_measurements = Column(Boolean, default=False)
     
@@ -211,7 +349,7 @@ class Evaluation(Base):
     model_version = Column(String(100))
     
     # Results and metrics
-    confidence_level = Column(String(20))  # low, medium, high, very_high
+    confidence_level = Column(InternedString(20))  # low, medium, high, very_high
     
     # Carbon metrics
     estimated_co2_sequestered_tons = Column(Float)
@@ -245,77 +383,192 @@ class Evaluation(Base):
     spatial_resolution_meters = Column(Float)
     
     # Detailed results (JSON storage for flexible metrics)
-    detailed_results = Column(Text)  # JSON as TEXT
+    detailed_results = Column(JSON)
     
     # Processing information
     processing_time_seconds = Column(Float)
-    algorithm_parameters = Column(Text)  # JSON as TEXT
+    algorithm_parameters = Column(MsgPackType)
     
     # Validation and verification
-    verified = Column(Boolean, default=False)
+    verified = Column(Boolean, default=False, index=True)
     verification_date = Column(DateTime)
     verification_notes = Column(Text)
     
     # Notes and comments
     notes = Column(Text)
     
-    # Metadata
-    created_at = Column(DateTime, server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
-    
-    # Relationships
+    # created_at / updated_at come from TimestampMixin
+
+    # Same projection trick as Project.LIST_COLUMNS: the to_dict key set,
+    # minus detailed_results, algorithm_parameters, notes and
+    # verification_notes.
+    LIST_COLUMNS = (
+        "id", "project_id", "evaluation_type", "status",
+        "evaluation_date", "period_start", "period_end",
+        "confidence_level", "estimated_co2_sequestered_tons",
+        "co2_sequestration_rate_tons_per_hectare", "ndvi_average",
+        "vegetation_cover_percentage", "biomass_estimate_tons",
+        "deforestation_detected", "data_quality_score",
+        "verified", "created_at",
+    )
+
+    @classmethod
+    def query_for_list(cls):
+        """Base select for list endpoints, loading only LIST_COLUMNS."""
+        return select(cls).options(
+            load_only(*(getattr(cls, name) for name in cls.LIST_COLUMNS))
+        )
+
+    @classmethod
+    async def stream_all(cls, session, batch: int = 1000):
+        """Yield every row as an orjson-encoded NDJSON line.
+
+        See Project.stream_all.
+        """
+        result = await session.stream(
+            cls.query_for_list().execution_options(
+                yield_per=batch, stream_results=True
+            )
+        )
+        async for row in result.scalars():
+            yield orjson.dumps(row.to_dict()) + b"\n"
+
+    # Relationships. Left on the default lazy loading: no serializer or
+    # endpoint reads evaluation.project today, so eager loading would add
+    # an unconditional SELECT per batch for rows nobody uses. Switch to
+    # lazy="selectin" if list paths start touching the parent project.
     project = relationship("Project", foreign_keys=[project_id])
     
+    # See Project._REPR.
+    _REPR = "<Evaluation(id={id}, project_id={project_id}, type={evaluation_type}, status={status})>"
+
     def __repr__(self):
-        return f"<Evaluation(id={self.id}, project_id={self.project_id}, type={self.evaluation_type}, status={self.status})>"
-    
-    @property
+        try:
+            return self._REPR.format_map(self.__dict__)
+        except KeyError:
+            return (f"<Evaluation(id={self.id}, project_id={self.project_id}, "
+                    f"type={self.evaluation_type}, status={self.status})>")
+    
+    # Memoized like the Project properties above; invalidated on mutation
+    # by _invalidate_cached.
+    @cached_property
     def is_completed(self) -> bool:
         """Check if evaluation is completed."""
-        return self.status == "completed"
-    
-    @property
+        return self.status == _COMPLETED
+
+    @cached_property
     def has_high_confidence(self) -> bool:
         """Check if evaluation has high confidence level."""
-        return self.confidence_level in ["high", "very_high"]
-    
-    @property
+        return self.confidence_level in (_HIGH, _VERY_HIGH)
+
+    @cached_property
     def co2_efficiency_rating(self) -> Optional[str]:
         """Calculate CO2 efficiency rating based on sequestration rate."""
-        if not self.co2_sequestration_rate_tons_per_hectare:
-            return None
-        
         rate = self.co2_sequestration_rate_tons_per_hectare
-        if rate >= 10:
-            return "excellent"
-        elif rate >= 7:
-            return "good"
-        elif rate >= 4:
-            return "average"
-        elif rate >= 2:
-            return "below_average"
-        else:
-            return "poor"
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert evaluation to dictionary representation."""
-        return {
-            "id": self.id,
-            "project_id": self.project_id,
-            "evaluation_type": self.evaluation_type,
-            "status": self.status,
-            "evaluation_date": self.evaluation_date.isoformat() if self.evaluation_date else None,
-            "period_start": self.period_start.isoformat() if self.period_start else None,
-            "period_end": self.period_end.isoformat() if self.period_end else None,
-            "confidence_level": self.confidence_level,
-            "estimated_co2_sequestered_tons": self.estimated_co2_sequestered_tons,
-            "co2_sequestration_rate_tons_per_hectare": self.co2_sequestration_rate_tons_per_hectare,
-            "ndvi_average": self.ndvi_average,
-            "vegetation_cover_percentage": self.vegetation_cover_percentage,
-            "biomass_estimate_tons": self.biomass_estimate_tons,
-            "deforestation_detected": self.deforestation_detected,
-            "data_quality_score": self.data_quality_score,
-            "verified": self.verified,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "co2_efficiency_rating": self.co2_efficiency_rating,
-        }
\ No newline at end of file
+        if not rate:
+            return None
+        return _RATING_LABELS[bisect.bisect_right(_RATING_THRESHOLDS, rate)]
+
+    @validates("status", "confidence_level",
+               "co2_sequestration_rate_tons_per_hectare")
+    def _invalidate_cached(self, key, value):
+        """Drop memoized derived values when one of their inputs changes."""
+        for cached in ("is_completed", "has_high_confidence",
+                       "co2_efficiency_rating"):
+            self.__dict__.pop(cached, None)
+        return value
+
+    @classmethod
+    def bulk_to_dicts(cls, session, project_id: Optional[int] = None) -> list:
+        """Serialize many evaluations without per-row ORM overhead.
+
+        Equivalent to [e.to_dict() for e in query] but fetches only the
+        exported columns, converts the datetime columns in one vectorized
+        strftime pass and derives the efficiency rating branchlessly,
+        instead of paying attribute access and isoformat per row.
+        """
+        import numpy as np
+        import pandas as pd
+
+        columns = [
+            "id", "project_id", "evaluation_type", "status",
+            "evaluation_date", "period_start", "period_end",
+            "confidence_level", "estimated_co2_sequestered_tons",
+            "co2_sequestration_rate_tons_per_hectare", "ndvi_average",
+            "vegetation_cover_percentage", "biomass_estimate_tons",
+            "deforestation_detected", "data_quality_score",
+            "verified", "created_at",
+        ]
+        query = session.query(*[getattr(cls, name) for name in columns])
+        if project_id is not None:
+            query = query.filter(cls.project_id == project_id)
+
+        df = pd.DataFrame(query.all(), columns=columns)
+
+        for col in ("evaluation_date", "period_start", "period_end", "created_at"):
+            df[col] = pd.to_datetime(df[col]).dt.strftime('%Y-%m-%dT%H:%M:%S')
+
+        # Same ladder as the co2_efficiency_rating property
+        rate = df["co2_sequestration_rate_tons_per_hectare"]
+        rating = np.select(
+            [rate >= 10, rate >= 7, rate >= 4, rate >= 2],
+            ["excellent", "good", "average", "below_average"],
+            default="poor"
+        )
+        df["co2_efficiency_rating"] = np.where(
+            rate.notna() & (rate != 0), rating, None
+        )
+
+        df = df.where(pd.notna(df), None)
+        return df.to_dict('records')
+
+    # to_dict is generated from LIST_COLUMNS at the bottom of the module.
+
+# Specialized serializers, generated once from each model's LIST_COLUMNS
+# so the exported key set and the narrow list projection stay in sync by
+# construction. Regenerate by re-importing; the column tuples are the
+# single source of truth.
+Project.to_dict = _compile_to_dict(
+    Project.LIST_COLUMNS,
+    datetime_fields=("start_date", "end_date", "created_at", "updated_at"),
+    prelude=(
+        "area = get('project_area_hectares')",
+        "co2_year = get('estimated_co2_capture_tons_year')",
+    ),
+    derived=(
+        ("area_sqkm", "area / 100 if area else None"),
+        ("co2_capture_rate_per_hectare",
+         "co2_year / area if co2_year and area else None"),
+    ),
+    doc="Convert project to dictionary representation.",
+)
+
+Evaluation.to_dict = _compile_to_dict(
+    Evaluation.LIST_COLUMNS,
+    datetime_fields=("evaluation_date", "period_start", "period_end",
+                     "created_at"),
+    prelude=("rate = get('co2_sequestration_rate_tons_per_hectare')",),
+    derived=(
+        ("co2_efficiency_rating",
+         "_RATING_LABELS[bisect_right(_RATING_THRESHOLDS, rate)]"
+         " if rate else None"),
+    ),
+    namespace={
+        "bisect_right": bisect.bisect_right,
+        "_RATING_THRESHOLDS": _RATING_THRESHOLDS,
+        "_RATING_LABELS": _RATING_LABELS,
+    },
+    doc="Convert evaluation to dictionary representation.",
+)
+
+async def bulk_insert_evaluations(session, rows) -> None:
+    """
+    Insert many Evaluation rows via Core executemany.
+
+    Batch evaluation ingest through session.add() pays ORM unit-of-work
+    bookkeeping per row; the plain table insert sends the whole batch in
+    one executemany inside the caller's transaction. Row dicts use the
+    column names declared on Evaluation.
+    """
+    if rows:
+        await session.execute(Evaluation.__table__.insert(), rows)
@@ -0,0 +1,40 @@
+"""
+Serialization Cache
+
+In-process LRU cache for model to_dict() output, keyed by
+(table, id, updated_at). Because updated_at participates in the key, a
+row update simply makes the old entry unreachable — stale data is never
+served, the dead entry just ages out of the LRU.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
+
+_CACHE: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+_CACHE_MAX_ENTRIES = 4096
+
+def cached_to_dict(table: str, row_id, updated_at,
+                   build: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Return the cached dict for (table, row_id, updated_at), building and
+    storing it on a miss. Unsaved rows (missing id or updated_at) are
+    built fresh every time. Callers receive a shallow copy so mutating
+    the response cannot poison the cache.
+    """
+    if row_id is None or updated_at is None:
+        return build()
+
+    key = (table, row_id, updated_at)
+    cached = _CACHE.get(key)
+    if cached is None:
+        cached = build()
+        _CACHE[key] = cached
+        if len(_CACHE) > _CACHE_MAX_ENTRIES:
+            _CACHE.popitem(last=False)
+    else:
+        _CACHE.move_to_end(key)
+    return dict(cached)
+
+def clear_cache() -> None:
+    """Drop all cached serializations (mainly for tests)."""
+    _CACHE.clear()
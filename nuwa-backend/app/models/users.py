@@ -4,13 +4,16 @@ User Database Models
 SQLAlchemy models for user management and authentication.
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Enum, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Enum, Index, case, event, select, text
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.sql import func
 import enum
+import types
 from datetime import datetime
 from typing import Optional, Dict, Any
 
 from app.core.database import Base
+from app.models._mixins import TimestampMixin, DefaultedJSON
 
 class UserRole(enum.Enum):
     """User role enumeration."""
@@ -21,7 +24,85 @@ class UserRole(enum.Enum):
     VIEWER = "viewer"
     API_USER = "api_user"
 
-class User(Base):
+class Permission(enum.Enum):
+    """Fine-grained permissions checked on every API request."""
+    VIEW_PROJECT = "view_project"
+    CREATE_PROJECT = "create_project"
+    EDIT_PROJECT = "edit_project"
+    DELETE_PROJECT = "delete_project"
+    EVALUATE_PROJECT = "evaluate_project"
+    VERIFY_EVALUATION = "verify_evaluation"
+    MANAGE_USERS = "manage_users"
+    ACCESS_API = "access_api"
+
+# Role -> permission table. frozenset values make has_permission an O(1)
+# hashed membership test rather than a list scan per authorization check.
+# The maps built here are read on every request and never written, so
+# each is wrapped in MappingProxyType below: lookups skip dict-mutation
+# guards and accidental writes fail loudly.
+ROLE_PERMISSIONS = {
+    UserRole.ADMIN: frozenset(Permission),
+    UserRole.PROJECT_MANAGER: frozenset({
+        Permission.VIEW_PROJECT, Permission.CREATE_PROJECT,
+        Permission.EDIT_PROJECT, Permission.DELETE_PROJECT,
+        Permission.EVALUATE_PROJECT, Permission.ACCESS_API,
+    }),
+    UserRole.EVALUATOR: frozenset({
+        Permission.VIEW_PROJECT, Permission.EVALUATE_PROJECT,
+        Permission.VERIFY_EVALUATION,
+    }),
+    UserRole.DEVELOPER: frozenset({
+        Permission.VIEW_PROJECT, Permission.ACCESS_API,
+    }),
+    UserRole.VIEWER: frozenset({Permission.VIEW_PROJECT}),
+    UserRole.API_USER: frozenset({
+        Permission.VIEW_PROJECT, Permission.ACCESS_API,
+    }),
+}
+
+# Immutable per-role tuples, precomputed so introspection endpoints never
+# rebuild them.
+ROLE_PERMISSION_TUPLES = types.MappingProxyType({
+    role: tuple(sorted(p.value for p in perms))
+    for role, perms in ROLE_PERMISSIONS.items()
+})
+
+# Bit encoding of the table above: each Permission gets a bit index and
+# each role collapses to one int, so has_permission is two integer ops —
+# branchless and cheaper than a set probe on the per-request auth path.
+PERM_BIT = types.MappingProxyType(
+    {permission: 1 << i for i, permission in enumerate(Permission)})
+ROLE_MASK = types.MappingProxyType({
+    role: sum(PERM_BIT[p] for p in perms)
+    for role, perms in ROLE_PERMISSIONS.items()
+})
+
+ROLE_PERMISSIONS = types.MappingProxyType(ROLE_PERMISSIONS)
+
+def has_permission(user_role: UserRole, permission: Permission) -> bool:
+    """Check whether a role grants a permission (single bit test)."""
+    return bool(ROLE_MASK.get(user_role, 0) & PERM_BIT[permission])
+
+def get_role_permissions(user_role: UserRole) -> tuple:
+    """Return the precomputed permission value tuple for a role."""
+    return ROLE_PERMISSION_TUPLES.get(user_role, ())
+
+# Role sets for the membership properties on User: precomputed frozensets
+# make the checks O(1) hash probes instead of building a list of members
+# per access. _ROLE_VALUE maps each member to its stored string so hot
+# serializers skip the .value descriptor dispatch.
+_CAN_CREATE_PROJECTS = frozenset({UserRole.ADMIN, UserRole.PROJECT_MANAGER})
+_CAN_EVALUATE_PROJECTS = _CAN_CREATE_PROJECTS | {UserRole.EVALUATOR}
+_ROLE_VALUE = types.MappingProxyType({role: role.value for role in UserRole})
+
+# Single shared Enum type instance. Building Enum(UserRole) inline in a
+# Column creates a fresh type object per declaration, and values_callable
+# stores the .value strings in the database directly, avoiding a
+# name->member dict lookup when each row is materialized.
+_ROLE_ENUM = Enum(UserRole, name='userrole',
+                  values_callable=lambda e: [m.value for m in e])
+
+class User(TimestampMixin, Base):
     """
     User Model
     
@@ -29,13 +110,24 @@ class User(Base):
     and authorization capabilities.
     """
     __tablename__ = "users"
-    
+    __table_args__ = (
+        # Containment queries on user preferences (JSONB @>).
+        Index('ix_users_preferences_gin', 'preferences', postgresql_using='gin'),
+        # Login lookup: filter (email, is_active) and read the covered
+        # password/role payload straight off the index (index-only scan).
+        Index('ix_users_email_active', 'email', 'is_active',
+              postgresql_include=['hashed_password', 'role']),
+        # API-key auth: only api-enabled rows are worth indexing.
+        Index('ix_users_apikey_enabled', 'api_key', 'api_enabled',
+              postgresql_where=text('api_enabled')),
+    )
+
     # Primary identification
     id = Column(Integer, primary_key=True, index=True)
     
     # Authentication
     username = Column(String(100), unique=True, nullable=False, index=True)
-    email = Column(String(200), unique=True, nullable=False, index=True)
+    email = Column(String(200), unique=True, nullable=False)
     hashed_password = Column(String(255), nullable=False)
     
     # Profile information
@@ -49,20 +141,21 @@ class User(Base):
     timezone = Column(String(100))
     
     # Role and permissions
-    role = Column(Enum(UserRole), default=UserRole.VIEWER, nullable=False)
+    role = Column(_ROLE_ENUM, default=UserRole.VIEWER, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
     is_verified = Column(Boolean, default=False, nullable=False)
     
     # API access
-    api_key = Column(String(255), unique=True, index=True)
+    api_key = Column(String(255), unique=True)
     api_enabled = Column(Boolean, default=False, nullable=False)
     
     # Activity tracking
     last_login = Column(DateTime)
     login_count = Column(Integer, default=0)
     
-    # User preferences
-    preferences = Column(JSON, default=dict)
+    # User preferences (JSONB so the GIN index above can serve filters;
+    # absent values read as the shared empty mapping)
+    preferences = Column(DefaultedJSON)
     
     # Account status
     email_verified = Column(Boolean, default=False, nullable=False)
@@ -72,10 +165,8 @@ class User(Base):
     password_reset_token = Column(String(255))
     password_reset_expires = Column(DateTime)
     
-    # Metadata
-    created_at = Column(DateTime, server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
-    
+    # created_at / updated_at come from TimestampMixin
+
     def __repr__(self):
         return f"<User(id={self.id}, username='{self.username}', role={self.role})>"
     
@@ -87,25 +178,98 @@ class User(Base):
     @property
     def can_create_projects(self) -> bool:
         """Check if user can create projects."""
-        return self.role in [UserRole.ADMIN, UserRole.PROJECT_MANAGER]
-    
+        return self.role in _CAN_CREATE_PROJECTS
+
     @property
     def can_evaluate_projects(self) -> bool:
         """Check if user can evaluate projects."""
-        return self.role in [UserRole.ADMIN, UserRole.PROJECT_MANAGER, UserRole.EVALUATOR]
+        return self.role in _CAN_EVALUATE_PROJECTS
     
     @property
     def can_access_api(self) -> bool:
         """Check if user can access API."""
         return self.api_enabled and self.is_active
-    
+
+    @hybrid_property
+    def password_reset_pending(self) -> bool:
+        """Check if an unexpired password-reset token is outstanding."""
+        return (self.password_reset_token is not None
+                and self.password_reset_expires is not None
+                and self.password_reset_expires > datetime.utcnow())
+
+    @password_reset_pending.expression
+    def password_reset_pending(cls):
+        # SQL form so filters evaluate the clock once in the database
+        # instead of materializing every row and calling utcnow() per user.
+        return case(
+            ((cls.password_reset_token.isnot(None))
+             & (cls.password_reset_expires > func.now()), True),
+            else_=False,
+        )
+
+    # Column sets behind dict_rows; together they mirror the to_dict
+    # payload.
+    DICT_COLUMNS = (
+        "id", "username", "email", "full_name", "organization",
+        "job_title", "role", "is_active", "is_verified",
+        "last_login", "created_at",
+    )
+    SENSITIVE_COLUMNS = ("api_key", "api_enabled", "email_verified",
+                         "preferences")
+
+    @classmethod
+    async def dict_rows(cls, session, ids=None,
+                        include_sensitive: bool = False) -> list:
+        """Serialize many users without materializing ORM instances.
+
+        Selecting column tuples skips the instrumented attribute
+        bookkeeping that dominates per-row ORM cost on list endpoints;
+        dicts are built straight from the row tuples. Instance to_dict
+        stays for single-object callers.
+        """
+        names = cls.DICT_COLUMNS
+        if include_sensitive:
+            names = names + cls.SENSITIVE_COLUMNS
+        query = select(*(getattr(cls, name) for name in names))
+        if ids is not None:
+            query = query.where(cls.id.in_(ids))
+        result = await session.execute(query)
+        rows = []
+        for row in result:
+            data = dict(zip(names, row))
+            data["role"] = _ROLE_VALUE.get(data["role"])
+            if include_sensitive:
+                preferences = data["preferences"]
+                data["preferences"] = dict(preferences) if preferences else {}
+            last_login = data["last_login"]
+            data["last_login"] = last_login.isoformat() if last_login else None
+            created_at = data["created_at"]
+            data["created_at"] = created_at.isoformat() if created_at else None
+            rows.append(data)
+        return rows
+
     def to_dict(self, include_sensitive: bool = False) -> Dict[str, Any]:
         """
         Convert user to dictionary representation.
-        
+
         Args:
             include_sensitive: Whether to include sensitive information
+
+        The built dict is cached on the instance (one entry per
+        include_sensitive variant) since profile and admin views call
+        this repeatedly on the same loaded rows; the event listeners at
+        the bottom of the module clear the cache on mutation, refresh
+        and expiry. Callers get a shallow copy they may alter.
         """
+        cache = self.__dict__.get("_cached_dicts")
+        if cache is None:
+            cache = self.__dict__["_cached_dicts"] = {}
+        data = cache.get(include_sensitive)
+        if data is None:
+            data = cache[include_sensitive] = self._build_dict(include_sensitive)
+        return dict(data)
+
+    def _build_dict(self, include_sensitive: bool) -> Dict[str, Any]:
         data = {
             "id": self.id,
             "username": self.username,
@@ -113,7 +277,7 @@ class User(Base):
             "full_name": self.full_name,
             "organization": self.organization,
             "job_title": self.job_title,
-            "role": self.role.value if self.role else None,
+            "role": _ROLE_VALUE.get(self.role),
             "is_active": self.is_active,
             "is_verified": self.is_verified,
             "last_login": self.last_login.isoformat() if self.last_login else None,
@@ -125,7 +289,37 @@ class User(Base):
                 "api_key": self.api_key,
                 "api_enabled": self.api_enabled,
                 "email_verified": self.email_verified,
-                "preferences": self.preferences,
+                # Copy to a plain dict: the shared EMPTY_MAPPING proxy is
+                # not JSON-serializable.
+                "preferences": dict(self.preferences) if self.preferences else {},
             })
-        
-        return data
\ No newline at end of file
+
+        return data
+
+# to_dict cache invalidation: any column write, refresh or expiry drops
+# the cached payloads so the next to_dict rebuilds from current state.
+def _drop_dict_cache(target, *args):
+    target.__dict__.pop("_cached_dicts", None)
+
+def _drop_dict_cache_on_set(target, value, oldvalue, initiator):
+    target.__dict__.pop("_cached_dicts", None)
+    return value
+
+event.listen(User, 'refresh', _drop_dict_cache)
+event.listen(User, 'expire', _drop_dict_cache)
+for _name in (*User.DICT_COLUMNS, *User.SENSITIVE_COLUMNS):
+    if _name != "id":
+        event.listen(getattr(User, _name), 'set',
+                     _drop_dict_cache_on_set, retval=True)
+del _name
+
+def password_reset_pending_at(user: User, now: datetime) -> bool:
+    """Batch variant of User.password_reset_pending.
+
+    Code paths that sweep many users (admin exports, token cleanup) call
+    this with one timestamp for the whole batch instead of paying a
+    datetime.utcnow() call per row.
+    """
+    return (user.password_reset_token is not None
+            and user.password_reset_expires is not None
+            and user.password_reset_expires > now)
\ No newline at end of file
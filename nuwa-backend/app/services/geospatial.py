@@ -7,17 +7,79 @@ Business logic for geospatial data management and satellite imagery analysis.
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_
 from typing import List, Optional, Dict, Any, Tuple
+import hashlib
 import logging
+import numpy as np
 from datetime import datetime, timedelta
 from fastapi import UploadFile
 
-from app.models.geospatial import GeospatialData, SatelliteImage, DataSource, ProcessingStatus
+from app.models.geospatial import (
+    GeospatialData, GeospatialDataBlobs, SatelliteImage, DataSource, ProcessingStatus
+)
 from app.models.projects import Project
 from app.schemas.geospatial import GeospatialDataCreate
 from app.core.logging_config import RequestLogger
 
 logger = logging.getLogger("app.services.geospatial")
 
+# Shared generator for the synthetic vegetation kernel below.
+_RNG = np.random.default_rng()
+
+# Climate-zone tables for the synthetic kernel, indexed by
+# searchsorted(_ZONE_EDGES, |lat|): tropics, subtropics, temperate,
+# boreal. Table gathers replace the comparison cascade, keeping the
+# batch path branch-free and SIMD-friendly.
+_ZONE_EDGES = np.array([23.5, 35.0, 50.0])
+_BASE_NDVI = np.array([0.8, 0.7, 0.6, 0.4])
+_SEASONALITY = np.array([0.05, 0.10, 0.15, 0.20])
+
+def _synthetic_vegetation_batch(lats, lons, dates) -> Dict[str, np.ndarray]:
+    """Generate synthetic vegetation indices for many points in one pass.
+
+    Stands in for real imagery processing until that lands. Everything is
+    vectorized and branch-free: climate zone is a searchsorted gather
+    into the module tables above, the seasonal factor is one np.sin over
+    month offsets (hemisphere phase chosen with np.where), noise is a
+    single rng.normal draw and the final clip runs over the whole batch
+    — no per-point Python loop.
+
+    Args:
+        lats / lons: coordinate arrays (lons reserved for future use)
+        dates: datetime64-coercible acquisition dates, same length
+
+    Returns:
+        Dict of float arrays: ndvi, evi, savi,
+        vegetation_cover_percentage.
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    months = np.asarray(dates, dtype='datetime64[M]').astype(np.int64) % 12 + 1
+
+    # side='right' keeps the old strict-< zone boundaries (|lat| of
+    # exactly 23.5 falls into the subtropics bucket).
+    zone = np.searchsorted(_ZONE_EDGES, np.abs(lats), side='right')
+    base_ndvi = _BASE_NDVI[zone]
+    # Peak growing season: March in the north, September in the south.
+    phase = np.where(lats >= 0, 3, 9)
+    seasonal = _SEASONALITY[zone] * np.sin((months - phase) * (np.pi / 6))
+    noise = _RNG.normal(0.0, 0.05, size=lats.shape)
+
+    ndvi = np.clip(base_ndvi + seasonal + noise, 0.0, 1.0)
+    return {
+        "ndvi": ndvi,
+        "evi": np.clip(ndvi * 0.9 - 0.02, 0.0, 1.0),
+        "savi": np.clip(ndvi * 0.95 - 0.01, 0.0, 1.0),
+        "vegetation_cover_percentage": np.clip(ndvi * 110.0, 0.0, 100.0),
+    }
+
+def _synthetic_vegetation_point(lat: float, lon: float,
+                                date: datetime) -> Dict[str, float]:
+    """Scalar wrapper over _synthetic_vegetation_batch for one point."""
+    batch = _synthetic_vegetation_batch(
+        np.array([lat]), np.array([lon]),
+        np.array([date], dtype='datetime64[s]'),
+    )
+    return {key: float(values[0]) for key, values in batch.items()}
+
 class GeospatialService:
     """
     Service class for geospatial data management operations.
@@ -73,6 +135,7 @@ class GeospatialService:
                     spatial_resolution_meters=data_info.spatial_resolution_meters,
                     coordinate_system=data_info.coordinate_system or "EPSG:4326",
                     file_path=file_path,
+                    file_path_sha1=hashlib.sha1(file_path.encode()).digest() if file_path else None,
                     file_size_bytes=file_size,
                     file_format=file_format,
                     processing_status=ProcessingStatus.RAW,
@@ -80,7 +143,10 @@ class GeospatialService:
                     quality_score=data_info.quality_score,
                     spectral_bands=data_info.spectral_bands or [],
                     storage_location=file_path,
-                    metadata=data_info.metadata or {}
+                )
+                # Heavy payloads live in the 1:1 blobs table
+                geospatial_data.blobs = GeospatialDataBlobs(
+                    extra_metadata=data_info.metadata or {}
                 )
                 
                 # Add to database
@@ -204,25 +270,42 @@ class GeospatialService:
                 if not satellite_data:
                     raise ValueError("No suitable satellite data found for analysis")
                 
-                # Simulate vegetation analysis (in real implementation, this would process actual imagery)
+                # Simulate vegetation analysis (in real implementation, this
+                # would process actual imagery): one batched kernel call over
+                # all scene dates at the project location.
+                project = await self.db.get(Project, project_id)
+                lat = (project.latitude if project and project.latitude else 0.0)
+                lon = (project.longitude if project and project.longitude else 0.0)
+                dates = np.array(
+                    [d.acquisition_date or datetime.utcnow()
+                     for d in satellite_data],
+                    dtype='datetime64[s]',
+                )
+                veg = _synthetic_vegetation_batch(
+                    np.full(dates.shape, lat), np.full(dates.shape, lon), dates
+                )
+                ndvi = veg["ndvi"]
+
                 analysis_result = {
                     "project_id": project_id,
                     "data_sources_used": data_sources,
                     "scenes_analyzed": len(satellite_data),
                     "vegetation_indices": {
-                        "average_ndvi": 0.65,  # Simulated values
-                        "ndvi_change": 0.02,
-                        "evi": 0.58,
-                        "savi": 0.61
+                        "average_ndvi": round(float(ndvi.mean()), 3),
+                        "ndvi_change": round(float(ndvi[-1] - ndvi[0]), 3),
+                        "evi": round(float(veg["evi"].mean()), 3),
+                        "savi": round(float(veg["savi"].mean()), 3)
                     },
                     "vegetation_metrics": {
-                        "vegetation_cover_percentage": 75.3,
+                        "vegetation_cover_percentage": round(
+                            float(veg["vegetation_cover_percentage"].mean()), 1),
                         "biomass_estimate_tons_per_hectare": 45.2,
                         "leaf_area_index": 3.8
                     },
                     "temporal_analysis": {
-                        "trend": "increasing",
-                        "seasonal_variation": 0.15,
+                        "trend": ("increasing" if ndvi[-1] >= ndvi[0]
+                                  else "decreasing"),
+                        "seasonal_variation": round(float(ndvi.std()), 3),
                         "anomalies_detected": []
                     },
                     "quality_metrics": {
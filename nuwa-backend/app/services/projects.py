@@ -7,11 +7,12 @@ Business logic for carbon capture project management.
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_
 from typing import List, Optional, Dict, Any, Tuple
+import json
 import logging
 from datetime import datetime
 from geoalchemy2 import functions as geo_func
 
-from app.models.projects import Project, ProjectStatus, ProjectType
+from app.models.projects import Project, ProjectStatus, ProjectType, refresh_boundary_parts
 from app.models.evaluations import Evaluation
 from app.schemas.projects import (
     ProjectCreate, ProjectUpdate, ProjectValidationRequest,
@@ -81,9 +82,12 @@ class ProjectService:
                 
                 # Add to database
                 self.db.add(project)
+                await self.db.flush()
+                if project_data.boundary_geojson:
+                    await refresh_boundary_parts(self.db, project.id)
                 await self.db.commit()
                 await self.db.refresh(project)
-                
+
                 logger.info(f"Created project {project.id}: {project.name}")
                 return project
                 
@@ -189,9 +193,11 @@ class ProjectService:
                     elif field == "boundary_geojson":
                         if value:
                             await self._set_project_boundary(project, value)
+                            await self.db.flush()
+                            await refresh_boundary_parts(self.db, project.id)
                     else:
                         setattr(project, field, value)
-                
+
                 await self.db.commit()
                 await self.db.refresh(project)
                 
@@ -413,9 +419,8 @@ class ProjectService:
             geojson: GeoJSON polygon
         """
         try:
-            # Convert GeoJSON to PostGIS geometry
-            # This would typically use ST_GeomFromGeoJSON function
-            # For now, we'll store the raw coordinates
+            # Store the boundary as native PostGIS geometry so spatial
+            # queries hit the geometry index instead of re-parsing GeoJSON.
             if geojson.get("type") == "Polygon" and "coordinates" in geojson:
                 coordinates = geojson["coordinates"]
                 if coordinates and len(coordinates[0]) >= 4:
@@ -424,12 +429,13 @@ class ProjectService:
                     lat_sum = sum(point[1] for point in points[:-1])
                     lon_sum = sum(point[0] for point in points[:-1])
                     count = len(points) - 1
-                    
+
                     project.latitude = lat_sum / count
                     project.longitude = lon_sum / count
-                    
-                    # TODO: Set actual PostGIS geometry
-                    # project.boundary_geom = func.ST_GeomFromGeoJSON(geojson)
+
+                    project.boundary_geom = func.ST_SetSRID(
+                        func.ST_GeomFromGeoJSON(json.dumps(geojson)), 4326
+                    )
             
         except Exception as e:
             logger.warning(f"Failed to set project boundary: {str(e)}")
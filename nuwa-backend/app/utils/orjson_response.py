@@ -0,0 +1,22 @@
+"""
+orjson Response Class
+
+JSONResponse variant that renders with orjson instead of the stdlib
+encoder — roughly 5-6x faster and slightly smaller output, which matters
+on list endpoints serializing thousands of to_dict() payloads. orjson
+also serializes datetime and NumPy scalars natively.
+"""
+
+import orjson
+from fastapi.responses import JSONResponse
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson."""
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY,
+        )